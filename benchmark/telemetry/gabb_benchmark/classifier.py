@@ -11,6 +11,8 @@ from __future__ import annotations
 
 import re
 import shlex
+import sys
+from functools import lru_cache
 from typing import Any
 
 from .schemas import BashCommandInfo, ToolCall, TranscriptAnalysis
@@ -33,15 +35,34 @@ PYTHON_PATTERN = re.compile(r"^(?:python3?|pip3?)\b")
 RECURSIVE_FLAGS = {"-r", "-R", "--recursive", "-rn", "-Rn", "-nr", "-nR"}
 
 
+# Commands longer than this (heredocs, inline scripts) are parsed without
+# caching, since each cache entry keeps the full command string alive
+MAX_CACHED_COMMAND_LENGTH = 512
+
+# Number of distinct short commands kept in the parse cache
+COMMAND_CACHE_SIZE = 1024
+
+
 def parse_bash_command(command: str) -> BashCommandInfo:
     """Parse a Bash command into structured information.
 
+    Results for commands up to MAX_CACHED_COMMAND_LENGTH characters are
+    cached by command string, so repeated commands share one
+    BashCommandInfo; treat it as read-only.
+
     Args:
         command: The raw command string.
 
     Returns:
         BashCommandInfo with parsed details.
     """
+    if len(command) > MAX_CACHED_COMMAND_LENGTH:
+        return _parse_bash_command(command)
+    return _parse_bash_command_cached(command)
+
+
+def _parse_bash_command(command: str) -> BashCommandInfo:
+    """Parse a Bash command without caching; see parse_bash_command."""
     # Handle empty or whitespace-only commands
     command = command.strip()
     if not command:
@@ -57,7 +78,9 @@ def parse_bash_command(command: str) -> BashCommandInfo:
     if not parts:
         return BashCommandInfo(raw_command=command, command_type="empty")
 
-    base_cmd = parts[0]
+    # Command types are few and used as dict keys and in comparisons, so
+    # intern the ones taken from the command line
+    base_cmd = sys.intern(parts[0])
 
     # Determine command type
     if GREP_PATTERN.match(base_cmd):
@@ -90,6 +113,9 @@ def parse_bash_command(command: str) -> BashCommandInfo:
         return BashCommandInfo(raw_command=command, command_type=base_cmd)
 
 
+_parse_bash_command_cached = lru_cache(maxsize=COMMAND_CACHE_SIZE)(_parse_bash_command)
+
+
 def _parse_grep_command(command: str, parts: list[str]) -> BashCommandInfo:
     """Parse a grep/rg command."""
     flags = []
@@ -127,7 +153,7 @@ def _parse_grep_command(command: str, parts: list[str]) -> BashCommandInfo:
         pattern=pattern,
         target_path=target_path,
         is_recursive=is_recursive,
-        flags=flags,
+        flags=flags or None,
     )
 
 
@@ -158,13 +184,13 @@ def _parse_find_command(command: str, parts: list[str]) -> BashCommandInfo:
         pattern=pattern,
         target_path=target_path or ".",
         is_recursive=True,  # find is inherently recursive
-        flags=flags,
+        flags=flags or None,
     )
 
 
 def _parse_cat_command(command: str, parts: list[str]) -> BashCommandInfo:
     """Parse a cat/head/tail command."""
-    cmd_type = parts[0]
+    cmd_type = sys.intern(parts[0])
     flags = []
     target_path = None
 
@@ -188,7 +214,7 @@ def _parse_cat_command(command: str, parts: list[str]) -> BashCommandInfo:
         raw_command=command,
         command_type=cmd_type,
         target_path=target_path,
-        flags=flags,
+        flags=flags or None,
     )
 
 
@@ -198,8 +224,8 @@ def _parse_git_command(command: str, parts: list[str]) -> BashCommandInfo:
 
     return BashCommandInfo(
         raw_command=command,
-        command_type=f"git-{subcommand}" if subcommand else "git",
-        flags=parts[2:] if len(parts) > 2 else [],
+        command_type=sys.intern(f"git-{subcommand}") if subcommand else "git",
+        flags=parts[2:] if len(parts) > 2 else None,
     )
 
 
@@ -226,10 +252,19 @@ def classify_tool_calls(analysis: TranscriptAnalysis) -> None:
                 tc.bash_info = parse_bash_command(command)
 
 
+# Search patterns longer than this are checked without caching, for the
+# same reason as MAX_CACHED_COMMAND_LENGTH
+MAX_CACHED_PATTERN_LENGTH = 128
+
+# Number of distinct short search patterns kept in the identifier cache
+PATTERN_CACHE_SIZE = 4096
+
+
 def is_identifier_pattern(pattern: str) -> bool:
     """Check if a pattern looks like a code identifier.
 
     Identifiers are typically PascalCase, camelCase, snake_case, or SCREAMING_SNAKE_CASE.
+    Results for patterns up to MAX_CACHED_PATTERN_LENGTH characters are cached.
 
     Args:
         pattern: The search pattern to check.
@@ -237,6 +272,12 @@ def is_identifier_pattern(pattern: str) -> bool:
     Returns:
         True if the pattern looks like an identifier.
     """
+    if len(pattern) > MAX_CACHED_PATTERN_LENGTH:
+        return _is_identifier_pattern(pattern)
+    return _is_identifier_pattern_cached(pattern)
+
+
+def _is_identifier_pattern(pattern: str) -> bool:
     if not pattern:
         return False
 
@@ -267,6 +308,9 @@ def is_identifier_pattern(pattern: str) -> bool:
     return False
 
 
+_is_identifier_pattern_cached = lru_cache(maxsize=PATTERN_CACHE_SIZE)(_is_identifier_pattern)
+
+
 def get_tool_summary(analysis: TranscriptAnalysis) -> dict[str, Any]:
     """Get a summary of tool usage from an analysis.
 
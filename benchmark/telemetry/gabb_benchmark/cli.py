@@ -11,6 +11,7 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
 from typing import NoReturn
 
@@ -25,6 +26,18 @@ from .reporter import (
     print_rich_report,
 )
 from .rules import detect_opportunities
+from .schemas import TranscriptAnalysis
+
+
+def _positive_int(value: str) -> int:
+    """Parse a command line value that must be a whole number of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 
 def main(args: list[str] | None = None) -> int:
@@ -53,6 +66,9 @@ Examples:
 
     # Analyze multiple transcripts
     gabb-benchmark analyze *.json --summary
+
+    # Analyze many transcripts in parallel
+    gabb-benchmark analyze *.json --summary --jobs 8
 """,
     )
     parser.add_argument(
@@ -94,6 +110,13 @@ Examples:
         action="store_true",
         help="Show aggregate summary across all files",
     )
+    analyze_parser.add_argument(
+        "--jobs",
+        "-j",
+        type=_positive_int,
+        default=1,
+        help="Analyze multiple files in this many worker processes (default: 1)",
+    )
 
     parsed = parser.parse_args(args)
 
@@ -107,6 +130,36 @@ Examples:
     return 0
 
 
+def analyze_file(filepath: Path) -> list[TranscriptAnalysis]:
+    """Load and fully analyze the transcript(s) in a file.
+
+    Args:
+        filepath: Path to a JSON or JSONL transcript.
+
+    Returns:
+        Analyses with tool calls classified, tokens estimated and
+        opportunities detected.
+    """
+    # Load transcript(s)
+    if filepath.suffix == ".jsonl":
+        analyses = [load_jsonl_transcript(filepath)]
+    else:
+        analyses = [load_transcript(filepath)]
+
+    # Process each transcript
+    for analysis in analyses:
+        # Classify tool calls (parse Bash commands)
+        classify_tool_calls(analysis)
+
+        # Estimate tokens
+        estimate_transcript_tokens(analysis)
+
+        # Detect gabb optimization opportunities (Phase 2)
+        analysis.opportunities = detect_opportunities(analysis)
+
+    return analyses
+
+
 def cmd_analyze(args: argparse.Namespace) -> int:
     """Handle the analyze command.
 
@@ -118,49 +171,50 @@ def cmd_analyze(args: argparse.Namespace) -> int:
     """
     all_analyses = []
 
-    for filepath in args.files:
-        if not filepath.exists():
-            print(f"Error: File not found: {filepath}", file=sys.stderr)
-            return 1
-
-        try:
-            # Load transcript(s)
-            if filepath.suffix == ".jsonl":
-                analyses = [load_jsonl_transcript(filepath)]
-            else:
-                analyses = [load_transcript(filepath)]
-
-            # Process each transcript
-            for analysis in analyses:
-                # Classify tool calls (parse Bash commands)
-                classify_tool_calls(analysis)
-
-                # Estimate tokens
-                estimate_transcript_tokens(analysis)
-
-                # Detect gabb optimization opportunities (Phase 2)
-                opportunities = detect_opportunities(analysis)
-                analysis.opportunities = opportunities
-
-                all_analyses.append(analysis)
-
-                # Output individual report (unless --summary)
-                if not args.summary:
-                    if args.format == "json":
-                        print(generate_json_report(analysis))
-                    elif args.format == "text":
-                        print(generate_text_report(analysis))
-                    elif args.format == "markdown":
-                        print(generate_markdown_report(analysis, verbose=args.verbose))
-                    else:  # rich
-                        print_rich_report(analysis, verbose=args.verbose)
-
-        except json.JSONDecodeError as e:
-            print(f"Error: Invalid JSON in {filepath}: {e}", file=sys.stderr)
-            return 1
-        except Exception as e:
-            print(f"Error processing {filepath}: {e}", file=sys.stderr)
-            return 1
+    # With --jobs, files are analyzed in worker processes up front and the
+    # results are consumed (and reported) in command-line order below
+    executor: ProcessPoolExecutor | None = None
+    futures: list[Future[list[TranscriptAnalysis]] | None] = []
+    if args.jobs > 1 and len(args.files) > 1:
+        executor = ProcessPoolExecutor(max_workers=args.jobs)
+        futures = [
+            executor.submit(analyze_file, filepath) if filepath.exists() else None
+            for filepath in args.files
+        ]
+
+    try:
+        for i, filepath in enumerate(args.files):
+            if not filepath.exists():
+                print(f"Error: File not found: {filepath}", file=sys.stderr)
+                return 1
+
+            try:
+                future = futures[i] if futures else None
+                analyses = future.result() if future is not None else analyze_file(filepath)
+
+                for analysis in analyses:
+                    all_analyses.append(analysis)
+
+                    # Output individual report (unless --summary)
+                    if not args.summary:
+                        if args.format == "json":
+                            generate_json_report(analysis, out=sys.stdout)
+                        elif args.format == "text":
+                            generate_text_report(analysis, out=sys.stdout)
+                        elif args.format == "markdown":
+                            print(generate_markdown_report(analysis, verbose=args.verbose))
+                        else:  # rich
+                            print_rich_report(analysis, verbose=args.verbose)
+
+            except json.JSONDecodeError as e:
+                print(f"Error: Invalid JSON in {filepath}: {e}", file=sys.stderr)
+                return 1
+            except Exception as e:
+                print(f"Error processing {filepath}: {e}", file=sys.stderr)
+                return 1
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
 
     # Print summary if requested
     if args.summary and all_analyses:
@@ -206,7 +260,7 @@ def print_summary(analyses: list, output_format: str) -> None:
             opp_type = opp.type.value
             opportunity_type_counts[opp_type] = opportunity_type_counts.get(opp_type, 0) + 1
 
-    total_potential_savings = sum(o.estimated_savings for o in all_opportunities)
+    total_potential_savings = sum(a.total_savings for a in analyses)
     total_tokens = total_input_tokens + total_output_tokens
     savings_percentage = (total_potential_savings / total_tokens * 100) if total_tokens > 0 else 0
 
@@ -7,6 +7,7 @@ estimation if tiktoken is not available.
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from typing import Any
 
 from .schemas import ToolCall, TranscriptAnalysis
@@ -129,6 +130,7 @@ def estimate_transcript_tokens(analysis: TranscriptAnalysis) -> None:
     analysis.file_content_tokens = file_content_tokens
 
 
+@lru_cache(maxsize=64)
 def estimate_gabb_tool_tokens(tool_name: str, result_size: str = "typical") -> int:
     """Estimate tokens for a hypothetical gabb tool call result.
 
@@ -25,11 +25,48 @@ Supports two formats:
 from __future__ import annotations
 
 import json
+import sys
+from itertools import chain
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, Iterable
 
 from .schemas import ToolCall, Turn, TranscriptAnalysis
 
+# Try to import orjson for faster JSON decoding (its JSONDecodeError
+# subclasses json.JSONDecodeError, so callers can catch either)
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    HAS_ORJSON = True
+except ImportError:
+    _json_loads = json.loads
+    HAS_ORJSON = False
+
+
+def _intern_name(name: Any) -> Any:
+    """Intern a tool name; they are few and compared constantly.
+
+    Non-string values (e.g. a null "name") are passed through unchanged.
+    """
+    if type(name) is str:
+        return sys.intern(name)
+    return name
+
+
+def _json_loads_utf(data: str | bytes) -> Any:
+    """Decode JSON from str, or from bytes in any UTF encoding.
+
+    orjson only accepts UTF-8 without a BOM, so bytes in any other UTF
+    encoding (which json.loads detects itself) are decoded to str first.
+    Both decoders then accept the same inputs; plain UTF-8 still goes to
+    the decoder as bytes.
+    """
+    if isinstance(data, str):
+        return _json_loads(data)
+    encoding = json.detect_encoding(data)
+    return _json_loads(data if encoding == "utf-8" else data.decode(encoding))
+
 
 def parse_transcript(data: dict[str, Any]) -> TranscriptAnalysis:
     """Parse a Claude Code transcript into structured analysis data.
@@ -100,7 +137,7 @@ def parse_transcript(data: dict[str, Any]) -> TranscriptAnalysis:
 
                     elif block_type == "tool_use":
                         tool_call = ToolCall(
-                            tool_name=block.get("name", "unknown"),
+                            tool_name=_intern_name(block.get("name", "unknown")),
                             tool_input=block.get("input", {}),
                             tool_use_id=block.get("id", ""),
                         )
@@ -151,13 +188,11 @@ def load_transcript(path: Path | str) -> TranscriptAnalysis:
         FileNotFoundError: If file doesn't exist.
         json.JSONDecodeError: If file isn't valid JSON.
     """
-    path = Path(path)
-    with open(path, "r") as f:
-        data = json.load(f)
+    data = _json_loads_utf(Path(path).read_bytes())
     return parse_transcript(data)
 
 
-def parse_claude_code_jsonl(records: list[dict[str, Any]]) -> TranscriptAnalysis:
+def parse_claude_code_jsonl(records: Iterable[dict[str, Any]]) -> TranscriptAnalysis:
     """Parse Claude Code native JSONL records into a TranscriptAnalysis.
 
     This handles the native JSONL format where each line is a separate record:
@@ -166,7 +201,8 @@ def parse_claude_code_jsonl(records: list[dict[str, Any]]) -> TranscriptAnalysis
     - type: "queue-operation" - Internal, ignored
 
     Args:
-        records: List of parsed JSON records from a JSONL file.
+        records: Parsed JSON records from a JSONL file, in order. Any
+            iterable works; it is consumed in a single pass.
 
     Returns:
         TranscriptAnalysis with extracted turns and tool calls.
@@ -219,7 +255,7 @@ def parse_claude_code_jsonl(records: list[dict[str, Any]]) -> TranscriptAnalysis
 
                     elif block_type == "tool_use":
                         tool_call = ToolCall(
-                            tool_name=block.get("name", "unknown"),
+                            tool_name=_intern_name(block.get("name", "unknown")),
                             tool_input=block.get("input", {}),
                             tool_use_id=block.get("id", ""),
                         )
@@ -265,39 +301,62 @@ def parse_claude_code_jsonl(records: list[dict[str, Any]]) -> TranscriptAnalysis
     return analysis
 
 
-def load_jsonl_transcript(path: Path | str) -> TranscriptAnalysis:
-    """Load a Claude Code transcript from a JSONL file.
+def load_jsonl_transcript(
+    source: Path | str | IO[bytes] | IO[str],
+) -> TranscriptAnalysis:
+    """Load a Claude Code transcript from a JSONL file or open stream.
 
     Automatically detects the format:
     - Claude Code native JSONL (records with "type" field)
     - Messages API JSONL (one complete transcript per line)
 
+    Lines are decoded one at a time as they are read, so the whole file is
+    never held in memory.
+
     Args:
-        path: Path to JSONL file.
+        source: Path to JSONL file, or a binary or text stream to read it
+            from (e.g. ``sys.stdin.buffer``).
 
     Returns:
         TranscriptAnalysis for the transcript.
     """
-    path = Path(path)
-    records = []
+    if hasattr(source, "read"):
+        return _parse_jsonl_lines(source)
+    with open(source, "rb") as f:
+        return _parse_jsonl_lines(f)
 
-    with open(path, "r") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                records.append(json.loads(line))
 
-    if not records:
-        return TranscriptAnalysis()
+def parse_jsonl_transcript(data: str | bytes) -> TranscriptAnalysis:
+    """Parse a Claude Code transcript from JSONL content.
+
+    Detects the format the same way as load_jsonl_transcript.
+
+    Args:
+        data: JSONL content, one JSON record per line.
 
-    # Detect format based on first record
-    first_record = records[0]
+    Returns:
+        TranscriptAnalysis for the transcript.
+    """
+    # str.splitlines also breaks on U+2028, \x85 and other separators that
+    # JSON allows raw inside strings; bytes only split on \n and \r
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return _parse_jsonl_lines(data.splitlines())
+
+
+def _parse_jsonl_lines(lines: Iterable[str | bytes]) -> TranscriptAnalysis:
+    """Detect the JSONL format from the first record and parse the lines."""
+    records = (_json_loads_utf(line) for line in lines if line.strip())
+
+    first_record = next(records, None)
+    if first_record is None:
+        return TranscriptAnalysis()
 
     # Claude Code native format has "type" field at top level
     if "type" in first_record and first_record.get("type") in (
         "user", "assistant", "queue-operation"
     ):
-        return parse_claude_code_jsonl(records)
+        return parse_claude_code_jsonl(chain((first_record,), records))
 
     # Messages API format: each line is a complete transcript
     # Return analysis of first transcript
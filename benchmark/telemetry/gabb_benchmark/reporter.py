@@ -13,9 +13,11 @@ Phase 3: Reporting and Visualization
 from __future__ import annotations
 
 import json
-from typing import Any
+import sys
+from collections import defaultdict
+from typing import Any, Callable, NamedTuple, TextIO
 
-from .schemas import TranscriptAnalysis
+from .schemas import Opportunity, ToolCall, TranscriptAnalysis, Turn
 
 # Try to import rich for pretty output
 try:
@@ -27,32 +29,276 @@ try:
 except ImportError:
     HAS_RICH = False
 
+# Try to import orjson for faster JSON encoding
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+class Recommendation(NamedTuple):
+    """An actionable recommendation derived from detected opportunities."""
+
+    priority: int
+    title: str
+    description: str
+    impact: str
+    example: str
+
+
+class _RecTemplate(NamedTuple):
+    """Static text for a recommendation, keyed by opportunity type."""
+
+    priority: int
+    type_key: str
+    title: str
+    description: str  # Formatted with the opportunity ``count``
+    example: str
+
+
+# Recommendation templates, in priority order
+_REC_TEMPLATES = (
+    _RecTemplate(
+        priority=1,
+        type_key="read_to_structure",
+        title="Use gabb_structure before reading large files",
+        description=(
+            "Found {count} large file read(s) that could benefit from "
+            "gabb_structure first. This tool returns a cheap overview of symbols and "
+            "line numbers without the token cost of reading the full file."
+        ),
+        example="gabb_structure file=\"src/large_file.rs\" → then Read with offset/limit",
+    ),
+    _RecTemplate(
+        priority=2,
+        type_key="grep_to_usages",
+        title="Use gabb_usages for finding symbol references",
+        description=(
+            "Found {count} grep command(s) searching for symbol names. "
+            "gabb_usages provides semantic accuracy (won't match comments/strings) "
+            "and returns precise file:line:column locations."
+        ),
+        example="gabb_usages file=\"src/auth.ts\" line=42 character=10",
+    ),
+    _RecTemplate(
+        priority=3,
+        type_key="grep_to_symbol",
+        title="Use gabb_symbol for finding symbol definitions",
+        description=(
+            "Found {count} grep command(s) that appear to be searching "
+            "for where a symbol is defined. gabb_symbol provides instant lookup by name."
+        ),
+        example="gabb_symbol name=\"MyFunction\"",
+    ),
+    _RecTemplate(
+        priority=4,
+        type_key="multi_hop_to_definition",
+        title="Use gabb_definition for navigation chains",
+        description=(
+            "Found {count} multi-hop navigation pattern(s) (grep → read → locate). "
+            "gabb_definition collapses this to a single call that jumps from usage to definition."
+        ),
+        example="gabb_definition file=\"src/app.ts\" line=10 character=5",
+    ),
+    _RecTemplate(
+        priority=5,
+        type_key="find_grep_to_symbols",
+        title="Use gabb_symbols with filters for find+grep patterns",
+        description=(
+            "Found {count} find+grep combination(s). gabb_symbols supports "
+            "file glob patterns and name filters in a single query."
+        ),
+        example="gabb_symbols file=\"src/**/*.ts\" name_contains=\"handle\"",
+    ),
+    _RecTemplate(
+        priority=6,
+        type_key="grep_to_symbols",
+        title="Use gabb_symbols for code pattern searches",
+        description=(
+            "Found {count} grep command(s) searching for code patterns. "
+            "gabb_symbols provides indexed search with kind filters (function, class, etc.)."
+        ),
+        example="gabb_symbols kind=\"function\" name_contains=\"validate\"",
+    ),
+)
+
+
+# Row formats for the per-item tables, filled in with %
+_TXT_TOOL_ROW = "  %-30s %5d calls  %10s tokens"
+_TXT_BASH_ROW = "    %-26s %5d"
+_TXT_TURN_ROW = "  %-6d %-8d %12s %12s"
+_MD_TOOL_ROW = "| %s | %d | %s |"
+_MD_BASH_ROW = "| %s | %d |"
+_MD_TURN_ROW = "| %d | %d | %s | %s | %s |"
+
 
 def format_number(n: int) -> str:
     """Format a number with thousands separators."""
     return f"{n:,}"
 
 
-def generate_json_report(analysis: TranscriptAnalysis) -> str:
+def _truncate(text: str, width: int) -> str:
+    """Cut text to ``width`` characters, marking the cut with an ellipsis."""
+    return text if len(text) <= width else text[:width] + "..."
+
+
+def _render_default_md(i: int, tc: ToolCall) -> str:
+    return f"{i}. `{tc.tool_name}`"
+
+
+def _render_bash_md(i: int, tc: ToolCall) -> str:
+    if not tc.bash_info:
+        return _render_default_md(i, tc)
+    return f"{i}. `Bash`: `{_truncate(tc.bash_info.raw_command, 60)}`"
+
+
+def _render_read_md(i: int, tc: ToolCall) -> str:
+    file_path = tc.tool_input.get("file_path", "unknown")
+    return f"{i}. `Read`: `{file_path}`"
+
+
+def _render_grep_md(i: int, tc: ToolCall) -> str:
+    pattern = tc.tool_input.get("pattern", "")
+    return f"{i}. `Grep`: pattern=`{pattern}`"
+
+
+def _render_glob_md(i: int, tc: ToolCall) -> str:
+    pattern = tc.tool_input.get("pattern", "")
+    return f"{i}. `Glob`: `{pattern}`"
+
+
+# Markdown one-line renderers for the detailed tool-call listing, by tool name
+_MD_TOOL_RENDERERS: dict[str, Callable[[int, ToolCall], str]] = {
+    "Bash": _render_bash_md,
+    "Read": _render_read_md,
+    "Grep": _render_grep_md,
+    "Glob": _render_glob_md,
+}
+
+
+def _render_default_rich(i: int, tc: ToolCall) -> str:
+    return f"  {i}. {tc.tool_name}"
+
+
+def _render_bash_rich(i: int, tc: ToolCall) -> str:
+    if not tc.bash_info:
+        return _render_default_rich(i, tc)
+    return f"  {i}. [yellow]Bash[/yellow]: {_truncate(tc.bash_info.raw_command, 50)}"
+
+
+def _render_read_rich(i: int, tc: ToolCall) -> str:
+    file_path = tc.tool_input.get("file_path", "unknown")
+    return f"  {i}. [green]Read[/green]: {file_path}"
+
+
+def _render_grep_rich(i: int, tc: ToolCall) -> str:
+    pattern = tc.tool_input.get("pattern", "")
+    return f"  {i}. [magenta]Grep[/magenta]: pattern={pattern}"
+
+
+def _render_glob_rich(i: int, tc: ToolCall) -> str:
+    pattern = tc.tool_input.get("pattern", "")
+    return f"  {i}. [blue]Glob[/blue]: {pattern}"
+
+
+# Rich markup renderers for the detailed tool-call listing, by tool name
+_RICH_TOOL_RENDERERS: dict[str, Callable[[int, ToolCall], str]] = {
+    "Bash": _render_bash_rich,
+    "Read": _render_read_rich,
+    "Grep": _render_grep_rich,
+    "Glob": _render_glob_rich,
+}
+
+
+# Savings thresholds for grouping opportunities by impact
+HIGH_IMPACT_SAVINGS = 1000
+MEDIUM_IMPACT_SAVINGS = 500
+
+
+def _split_by_impact(
+    opportunities: list[Opportunity],
+) -> tuple[list[Opportunity], list[Opportunity], list[Opportunity]]:
+    """Split opportunities into high, medium and low impact.
+
+    Works in one pass and keeps the input order within each group, so it
+    does not rely on the list being sorted by savings.
+    """
+    high: list[Opportunity] = []
+    medium: list[Opportunity] = []
+    low: list[Opportunity] = []
+    for opp in opportunities:
+        if opp.estimated_savings >= HIGH_IMPACT_SAVINGS:
+            high.append(opp)
+        elif opp.estimated_savings >= MEDIUM_IMPACT_SAVINGS:
+            medium.append(opp)
+        else:
+            low.append(opp)
+    return high, medium, low
+
+
+def generate_json_report(
+    analysis: TranscriptAnalysis, *, out: TextIO | None = None
+) -> str | None:
     """Generate a JSON report from the analysis.
 
+    Uses orjson if available (which writes non-ASCII characters as UTF-8
+    rather than escaping them), otherwise the standard library encoder.
+
     Args:
         analysis: The analyzed transcript.
+        out: Optional stream to write the report (and a trailing newline)
+            to instead of returning it. With orjson, the encoded bytes go
+            straight to the stream's binary buffer when it has one.
 
     Returns:
-        JSON string with the full report.
+        JSON string with the full report, or None if it was written to ``out``.
     """
-    return json.dumps(analysis.to_dict(), indent=2)
-
-
-def generate_text_report(analysis: TranscriptAnalysis) -> str:
+    if not HAS_ORJSON:
+        report = json.dumps(analysis.to_dict(), indent=2)
+        if out is None:
+            return report
+        print(report, file=out)
+        return None
+
+    option = orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS
+    if out is not None:
+        option |= orjson.OPT_APPEND_NEWLINE
+    # Turns and opportunities are converted one at a time by the default
+    # hook, so their dicts never all exist at once
+    encoded = orjson.dumps(
+        analysis.to_shallow_dict(), default=_record_to_dict, option=option
+    )
+    if out is None:
+        return encoded.decode()
+    buffer = getattr(out, "buffer", None)
+    if buffer is None:
+        out.write(encoded.decode())
+    else:
+        out.flush()
+        buffer.write(encoded)
+    return None
+
+
+def _record_to_dict(obj: Any) -> dict[str, Any]:
+    """orjson default hook: serialize schema records through their to_dict."""
+    if isinstance(obj, (Turn, Opportunity)):
+        return obj.to_dict()
+    raise TypeError(f"Cannot serialize {type(obj).__name__}")
+
+
+def generate_text_report(
+    analysis: TranscriptAnalysis, *, out: TextIO | None = None
+) -> str | None:
     """Generate a plain text report from the analysis.
 
     Args:
         analysis: The analyzed transcript.
+        out: Optional stream to write the report to instead of returning it.
 
     Returns:
-        Formatted text report.
+        Formatted text report, or None if it was written to ``out``.
     """
     lines = []
     data = analysis.to_dict()
@@ -66,10 +312,7 @@ def generate_text_report(analysis: TranscriptAnalysis) -> str:
 
     # Task info
     if analysis.task_description:
-        desc = analysis.task_description[:80]
-        if len(analysis.task_description) > 80:
-            desc += "..."
-        lines.append(f"Task: {desc}")
+        lines.append(f"Task: {_truncate(analysis.task_description, 80)}")
         lines.append("")
 
     # Token summary
@@ -80,12 +323,7 @@ def generate_text_report(analysis: TranscriptAnalysis) -> str:
     lines.append(f"  Input tokens:         {format_number(summary['total_input_tokens'])}")
     lines.append(f"  Output tokens:        {format_number(summary['total_output_tokens'])}")
 
-    total_tokens = summary["total_input_tokens"] + summary["total_output_tokens"]
-    file_pct = (
-        (summary["file_content_tokens"] / total_tokens * 100)
-        if total_tokens > 0
-        else 0
-    )
+    file_pct = analysis.file_content_percentage
     lines.append(
         f"  File content tokens:  {format_number(summary['file_content_tokens'])} ({file_pct:.0f}%)"
     )
@@ -98,7 +336,7 @@ def generate_text_report(analysis: TranscriptAnalysis) -> str:
     for tool, stats in sorted(tool_dist.items()):
         count = stats["count"]
         tokens = stats["tokens"]
-        lines.append(f"  {tool:<30} {count:>5} calls  {format_number(tokens):>10} tokens")
+        lines.append(_TXT_TOOL_ROW % (tool, count, format_number(tokens)))
 
     # Bash breakdown if present
     bash_breakdown = data.get("bash_breakdown", {})
@@ -106,7 +344,7 @@ def generate_text_report(analysis: TranscriptAnalysis) -> str:
         lines.append("")
         lines.append("  Bash command breakdown:")
         for cmd, count in sorted(bash_breakdown.items(), key=lambda x: -x[1]):
-            lines.append(f"    {cmd:<26} {count:>5}")
+            lines.append(_TXT_BASH_ROW % (cmd, count))
 
     lines.append("")
 
@@ -116,27 +354,25 @@ def generate_text_report(analysis: TranscriptAnalysis) -> str:
         lines.append("-" * 70)
         lines.append(f"  {'Turn':<6} {'Tools':<8} {'Input':>12} {'Output':>12}")
         for turn in analysis.turns:
-            turn_data = turn.to_dict()
-            lines.append(
-                f"  {turn_data['turn_id']:<6} {len(turn.tool_calls):<8} "
-                f"{format_number(turn_data['input_tokens']):>12} "
-                f"{format_number(turn_data['output_tokens']):>12}"
-            )
+            lines.append(_TXT_TURN_ROW % (
+                turn.turn_id,
+                len(turn.tool_calls),
+                format_number(turn.input_tokens),
+                format_number(turn.output_tokens),
+            ))
 
     lines.append("")
 
     # Gabb opportunities (Phase 2)
-    if analysis.opportunities:
+    opportunities = analysis.opportunities
+    if opportunities:
         lines.append("GABB OPPORTUNITIES DETECTED")
         lines.append("-" * 70)
 
-        # Group by impact
-        high_impact = [o for o in analysis.opportunities if o.estimated_savings >= 1000]
-        medium_impact = [o for o in analysis.opportunities if 500 <= o.estimated_savings < 1000]
-        low_impact = [o for o in analysis.opportunities if o.estimated_savings < 500]
+        high_impact, medium_impact, low_impact = _split_by_impact(opportunities)
 
-        total_savings = sum(o.estimated_savings for o in analysis.opportunities)
-        lines.append(f"  Total opportunities: {len(analysis.opportunities)}")
+        total_savings = summary["potential_token_savings"]
+        lines.append(f"  Total opportunities: {len(opportunities)}")
         lines.append(f"  Potential savings:   {format_number(total_savings)} tokens")
         lines.append("")
 
@@ -163,126 +399,47 @@ def generate_text_report(analysis: TranscriptAnalysis) -> str:
 
     lines.append("=" * 70)
 
+    if out is not None:
+        print(*lines, sep="\n", file=out)
+        return None
+
     return "\n".join(lines)
 
 
-def generate_recommendations(analysis: TranscriptAnalysis) -> list[dict]:
+def generate_recommendations(analysis: TranscriptAnalysis) -> list[Recommendation]:
     """Generate actionable recommendations based on detected patterns.
 
     Args:
         analysis: The analyzed transcript.
 
     Returns:
-        List of recommendation dicts with priority, title, description, and impact.
+        List of recommendations, highest priority first.
     """
-    recommendations = []
+    recommendations: list[Recommendation] = []
     opportunities = analysis.opportunities
 
     if not opportunities:
         return recommendations
 
     # Count opportunity types
-    type_counts: dict[str, int] = {}
-    type_savings: dict[str, int] = {}
+    type_counts: dict[str, int] = defaultdict(int)
+    type_savings: dict[str, int] = defaultdict(int)
     for opp in opportunities:
         opp_type = opp.type.value
-        type_counts[opp_type] = type_counts.get(opp_type, 0) + 1
-        type_savings[opp_type] = type_savings.get(opp_type, 0) + opp.estimated_savings
-
-    # Recommendation 1: gabb_structure for large file reads
-    read_structure_count = type_counts.get("read_to_structure", 0)
-    if read_structure_count >= 1:
-        savings = type_savings.get("read_to_structure", 0)
-        recommendations.append({
-            "priority": 1,
-            "title": "Use gabb_structure before reading large files",
-            "description": (
-                f"Found {read_structure_count} large file read(s) that could benefit from "
-                f"gabb_structure first. This tool returns a cheap overview of symbols and "
-                f"line numbers without the token cost of reading the full file."
-            ),
-            "impact": f"~{format_number(savings)} tokens saved",
-            "example": "gabb_structure file=\"src/large_file.rs\" → then Read with offset/limit",
-        })
-
-    # Recommendation 2: gabb_usages for grep of symbol names
-    grep_usages_count = type_counts.get("grep_to_usages", 0)
-    if grep_usages_count >= 1:
-        savings = type_savings.get("grep_to_usages", 0)
-        recommendations.append({
-            "priority": 2,
-            "title": "Use gabb_usages for finding symbol references",
-            "description": (
-                f"Found {grep_usages_count} grep command(s) searching for symbol names. "
-                f"gabb_usages provides semantic accuracy (won't match comments/strings) "
-                f"and returns precise file:line:column locations."
-            ),
-            "impact": f"~{format_number(savings)} tokens saved",
-            "example": "gabb_usages file=\"src/auth.ts\" line=42 character=10",
-        })
-
-    # Recommendation 3: gabb_symbol for finding definitions
-    grep_symbol_count = type_counts.get("grep_to_symbol", 0)
-    if grep_symbol_count >= 1:
-        savings = type_savings.get("grep_to_symbol", 0)
-        recommendations.append({
-            "priority": 3,
-            "title": "Use gabb_symbol for finding symbol definitions",
-            "description": (
-                f"Found {grep_symbol_count} grep command(s) that appear to be searching "
-                f"for where a symbol is defined. gabb_symbol provides instant lookup by name."
-            ),
-            "impact": f"~{format_number(savings)} tokens saved",
-            "example": "gabb_symbol name=\"MyFunction\"",
-        })
-
-    # Recommendation 4: gabb_definition for multi-hop navigation
-    multi_hop_count = type_counts.get("multi_hop_to_definition", 0)
-    if multi_hop_count >= 1:
-        savings = type_savings.get("multi_hop_to_definition", 0)
-        recommendations.append({
-            "priority": 4,
-            "title": "Use gabb_definition for navigation chains",
-            "description": (
-                f"Found {multi_hop_count} multi-hop navigation pattern(s) (grep → read → locate). "
-                f"gabb_definition collapses this to a single call that jumps from usage to definition."
-            ),
-            "impact": f"~{format_number(savings)} tokens saved",
-            "example": "gabb_definition file=\"src/app.ts\" line=10 character=5",
-        })
-
-    # Recommendation 5: gabb_symbols for find+grep combos
-    find_grep_count = type_counts.get("find_grep_to_symbols", 0)
-    if find_grep_count >= 1:
-        savings = type_savings.get("find_grep_to_symbols", 0)
-        recommendations.append({
-            "priority": 5,
-            "title": "Use gabb_symbols with filters for find+grep patterns",
-            "description": (
-                f"Found {find_grep_count} find+grep combination(s). gabb_symbols supports "
-                f"file glob patterns and name filters in a single query."
-            ),
-            "impact": f"~{format_number(savings)} tokens saved",
-            "example": "gabb_symbols file=\"src/**/*.ts\" name_contains=\"handle\"",
-        })
-
-    # Recommendation 6: Generic grep to symbols
-    grep_symbols_count = type_counts.get("grep_to_symbols", 0)
-    if grep_symbols_count >= 1:
-        savings = type_savings.get("grep_to_symbols", 0)
-        recommendations.append({
-            "priority": 6,
-            "title": "Use gabb_symbols for code pattern searches",
-            "description": (
-                f"Found {grep_symbols_count} grep command(s) searching for code patterns. "
-                f"gabb_symbols provides indexed search with kind filters (function, class, etc.)."
-            ),
-            "impact": f"~{format_number(savings)} tokens saved",
-            "example": "gabb_symbols kind=\"function\" name_contains=\"validate\"",
-        })
-
-    # Sort by priority
-    recommendations.sort(key=lambda r: r["priority"])
+        type_counts[opp_type] += 1
+        type_savings[opp_type] += opp.estimated_savings
+
+    for tpl in _REC_TEMPLATES:
+        count = type_counts.get(tpl.type_key, 0)
+        if not count:
+            continue
+        recommendations.append(Recommendation(
+            priority=tpl.priority,
+            title=tpl.title,
+            description=tpl.description.format(count=count),
+            impact=f"~{format_number(type_savings[tpl.type_key])} tokens saved",
+            example=tpl.example,
+        ))
 
     return recommendations
 
@@ -313,12 +470,7 @@ def generate_markdown_report(analysis: TranscriptAnalysis, verbose: bool = False
     # Summary section
     lines.append("## Summary")
     lines.append("")
-    total_tokens = summary["total_input_tokens"] + summary["total_output_tokens"]
-    file_pct = (
-        (summary["file_content_tokens"] / total_tokens * 100)
-        if total_tokens > 0
-        else 0
-    )
+    file_pct = analysis.file_content_percentage
 
     lines.append(f"| Metric | Value |")
     lines.append(f"|--------|-------|")
@@ -336,7 +488,7 @@ def generate_markdown_report(analysis: TranscriptAnalysis, verbose: bool = False
     lines.append("|------|-------|--------|")
     tool_dist = data.get("tool_distribution", {})
     for tool, stats in sorted(tool_dist.items(), key=lambda x: -x[1]["count"]):
-        lines.append(f"| {tool} | {stats['count']} | {format_number(stats['tokens'])} |")
+        lines.append(_MD_TOOL_ROW % (tool, stats["count"], format_number(stats["tokens"])))
     lines.append("")
 
     # Bash breakdown
@@ -347,7 +499,7 @@ def generate_markdown_report(analysis: TranscriptAnalysis, verbose: bool = False
         lines.append("| Command | Count |")
         lines.append("|---------|-------|")
         for cmd, count in sorted(bash_breakdown.items(), key=lambda x: -x[1]):
-            lines.append(f"| {cmd} | {count} |")
+            lines.append(_MD_BASH_ROW % (cmd, count))
         lines.append("")
 
     # Per-turn breakdown (verbose mode)
@@ -356,66 +508,56 @@ def generate_markdown_report(analysis: TranscriptAnalysis, verbose: bool = False
         lines.append("")
         lines.append("| Turn | Tools | Input Tokens | Output Tokens | Details |")
         lines.append("|------|-------|--------------|---------------|---------|")
+
+        # Build the turn table and the detailed tool calls in a single pass
+        detail_lines: list[str] = []
         for turn in analysis.turns:
-            tool_names = [tc.tool_name for tc in turn.tool_calls]
-            tool_summary = ", ".join(tool_names[:3])
-            if len(tool_names) > 3:
-                tool_summary += f" (+{len(tool_names) - 3})"
-            lines.append(
-                f"| {turn.turn_id} | {len(turn.tool_calls)} | "
-                f"{format_number(turn.input_tokens)} | "
-                f"{format_number(turn.output_tokens)} | "
-                f"{tool_summary} |"
-            )
+            tool_calls = turn.tool_calls
+            tool_count = len(tool_calls)
+            tool_summary = ", ".join(tc.tool_name for tc in tool_calls[:3])
+            if tool_count > 3:
+                tool_summary += f" (+{tool_count - 3})"
+            lines.append(_MD_TURN_ROW % (
+                turn.turn_id,
+                tool_count,
+                format_number(turn.input_tokens),
+                format_number(turn.output_tokens),
+                tool_summary,
+            ))
+
+            if tool_calls:
+                detail_lines.append(f"**Turn {turn.turn_id}:**")
+                detail_lines.append("")
+                for i, tc in enumerate(tool_calls, 1):
+                    render = _MD_TOOL_RENDERERS.get(tc.tool_name, _render_default_md)
+                    detail_lines.append(render(i, tc))
+                detail_lines.append("")
         lines.append("")
 
         # Detailed tool calls per turn
         lines.append("### Detailed Tool Calls")
         lines.append("")
-        for turn in analysis.turns:
-            if turn.tool_calls:
-                lines.append(f"**Turn {turn.turn_id}:**")
-                lines.append("")
-                for i, tc in enumerate(turn.tool_calls, 1):
-                    if tc.tool_name == "Bash" and tc.bash_info:
-                        cmd_preview = tc.bash_info.raw_command[:60]
-                        if len(tc.bash_info.raw_command) > 60:
-                            cmd_preview += "..."
-                        lines.append(f"{i}. `Bash`: `{cmd_preview}`")
-                    elif tc.tool_name == "Read":
-                        file_path = tc.tool_input.get("file_path", "unknown")
-                        lines.append(f"{i}. `Read`: `{file_path}`")
-                    elif tc.tool_name == "Grep":
-                        pattern = tc.tool_input.get("pattern", "")
-                        lines.append(f"{i}. `Grep`: pattern=`{pattern}`")
-                    elif tc.tool_name == "Glob":
-                        pattern = tc.tool_input.get("pattern", "")
-                        lines.append(f"{i}. `Glob`: `{pattern}`")
-                    else:
-                        lines.append(f"{i}. `{tc.tool_name}`")
-                lines.append("")
+        lines.extend(detail_lines)
 
     # Gabb opportunities
-    if analysis.opportunities:
+    opportunities = analysis.opportunities
+    if opportunities:
         lines.append("## Gabb Optimization Opportunities")
         lines.append("")
 
-        total_savings = sum(o.estimated_savings for o in analysis.opportunities)
-        savings_pct = (total_savings / total_tokens * 100) if total_tokens > 0 else 0
+        total_savings = summary["potential_token_savings"]
+        savings_pct = summary["savings_percentage"]
 
-        lines.append(f"**{len(analysis.opportunities)} opportunities detected** with potential savings of **{format_number(total_savings)} tokens ({savings_pct:.1f}%)**")
+        lines.append(f"**{len(opportunities)} opportunities detected** with potential savings of **{format_number(total_savings)} tokens ({savings_pct:.1f}%)**")
         lines.append("")
 
-        # Group by impact
-        high_impact = [o for o in analysis.opportunities if o.estimated_savings >= 1000]
-        medium_impact = [o for o in analysis.opportunities if 500 <= o.estimated_savings < 1000]
-        low_impact = [o for o in analysis.opportunities if o.estimated_savings < 500]
+        high_impact, medium_impact, low_impact = _split_by_impact(opportunities)
 
         if high_impact:
             lines.append("### High Impact (>1,000 tokens each)")
             lines.append("")
             for opp in high_impact:
-                lines.append(f"- **Turn {opp.turn_id}**: `{opp.original_command[:60]}{'...' if len(opp.original_command) > 60 else ''}`")
+                lines.append(f"- **Turn {opp.turn_id}**: `{_truncate(opp.original_command, 60)}`")
                 lines.append(f"  - → `{opp.suggested_tool}`")
                 lines.append(f"  - Savings: {format_number(opp.estimated_savings)} tokens ({opp.confidence:.0%} confidence)")
                 lines.append(f"  - {opp.reason}")
@@ -438,15 +580,15 @@ def generate_markdown_report(analysis: TranscriptAnalysis, verbose: bool = False
         lines.append("## Recommendations")
         lines.append("")
         for rec in recommendations:
-            lines.append(f"### {rec['priority']}. {rec['title']}")
+            lines.append(f"### {rec.priority}. {rec.title}")
             lines.append("")
-            lines.append(rec["description"])
+            lines.append(rec.description)
             lines.append("")
-            lines.append(f"**Impact:** {rec['impact']}")
+            lines.append(f"**Impact:** {rec.impact}")
             lines.append("")
             lines.append(f"**Example:**")
             lines.append(f"```")
-            lines.append(rec["example"])
+            lines.append(rec.example)
             lines.append(f"```")
             lines.append("")
 
@@ -461,7 +603,7 @@ def print_rich_report(analysis: TranscriptAnalysis, verbose: bool = False) -> No
         verbose: Include detailed per-turn breakdown.
     """
     if not HAS_RICH:
-        print(generate_text_report(analysis))
+        generate_text_report(analysis, out=sys.stdout)
         return
 
     console = Console()
@@ -480,10 +622,7 @@ def print_rich_report(analysis: TranscriptAnalysis, verbose: bool = False) -> No
 
     # Task info
     if analysis.task_description:
-        desc = analysis.task_description[:100]
-        if len(analysis.task_description) > 100:
-            desc += "..."
-        console.print(f"[dim]Task:[/dim] {desc}")
+        console.print(f"[dim]Task:[/dim] {_truncate(analysis.task_description, 100)}")
         console.print()
 
     # Token summary table
@@ -496,12 +635,7 @@ def print_rich_report(analysis: TranscriptAnalysis, verbose: bool = False) -> No
     token_table.add_row("Input tokens", format_number(summary["total_input_tokens"]))
     token_table.add_row("Output tokens", format_number(summary["total_output_tokens"]))
 
-    total_tokens = summary["total_input_tokens"] + summary["total_output_tokens"]
-    file_pct = (
-        (summary["file_content_tokens"] / total_tokens * 100)
-        if total_tokens > 0
-        else 0
-    )
+    file_pct = analysis.file_content_percentage
     token_table.add_row(
         "File content tokens",
         f"{format_number(summary['file_content_tokens'])} ({file_pct:.0f}%)",
@@ -549,58 +683,51 @@ def print_rich_report(analysis: TranscriptAnalysis, verbose: bool = False) -> No
         turn_table.add_column("Output", justify="right")
         turn_table.add_column("Details", max_width=40)
 
+        # Build the turn table and the detailed tool calls in a single pass
+        detail_blocks: list[str] = []
         for turn in analysis.turns:
-            tool_names = [tc.tool_name for tc in turn.tool_calls]
-            tool_summary = ", ".join(tool_names[:3])
-            if len(tool_names) > 3:
-                tool_summary += f" (+{len(tool_names) - 3})"
+            tool_calls = turn.tool_calls
+            tool_count = len(tool_calls)
+            tool_summary = ", ".join(tc.tool_name for tc in tool_calls[:3])
+            if tool_count > 3:
+                tool_summary += f" (+{tool_count - 3})"
 
             turn_table.add_row(
                 str(turn.turn_id),
-                str(len(turn.tool_calls)),
+                str(tool_count),
                 format_number(turn.input_tokens),
                 format_number(turn.output_tokens),
                 tool_summary,
             )
 
+            if tool_calls:
+                # One markup block per turn so rich renders it in a single call
+                parts = [f"\n[cyan]Turn {turn.turn_id}:[/cyan]"]
+                for i, tc in enumerate(tool_calls, 1):
+                    render = _RICH_TOOL_RENDERERS.get(tc.tool_name, _render_default_rich)
+                    parts.append(render(i, tc))
+                detail_blocks.append("\n".join(parts))
+
         console.print(turn_table)
 
         # Detailed tool calls
         console.print()
         console.print("[bold]Detailed Tool Calls:[/bold]")
-        for turn in analysis.turns:
-            if turn.tool_calls:
-                console.print(f"\n[cyan]Turn {turn.turn_id}:[/cyan]")
-                for i, tc in enumerate(turn.tool_calls, 1):
-                    if tc.tool_name == "Bash" and tc.bash_info:
-                        cmd_preview = tc.bash_info.raw_command[:50]
-                        if len(tc.bash_info.raw_command) > 50:
-                            cmd_preview += "..."
-                        console.print(f"  {i}. [yellow]Bash[/yellow]: {cmd_preview}")
-                    elif tc.tool_name == "Read":
-                        file_path = tc.tool_input.get("file_path", "unknown")
-                        console.print(f"  {i}. [green]Read[/green]: {file_path}")
-                    elif tc.tool_name == "Grep":
-                        pattern = tc.tool_input.get("pattern", "")
-                        console.print(f"  {i}. [magenta]Grep[/magenta]: pattern={pattern}")
-                    elif tc.tool_name == "Glob":
-                        pattern = tc.tool_input.get("pattern", "")
-                        console.print(f"  {i}. [blue]Glob[/blue]: {pattern}")
-                    else:
-                        console.print(f"  {i}. {tc.tool_name}")
+        for block in detail_blocks:
+            console.print(block)
 
     # Gabb opportunities
-    if analysis.opportunities:
+    opportunities = analysis.opportunities
+    if opportunities:
         console.print()
 
         # Summary panel
-        total_savings = sum(o.estimated_savings for o in analysis.opportunities)
-        total_tokens = summary["total_input_tokens"] + summary["total_output_tokens"]
-        savings_pct = (total_savings / total_tokens * 100) if total_tokens > 0 else 0
+        total_savings = summary["potential_token_savings"]
+        savings_pct = summary["savings_percentage"]
 
         console.print(
             Panel.fit(
-                f"[bold green]{len(analysis.opportunities)}[/bold green] opportunities detected\n"
+                f"[bold green]{len(opportunities)}[/bold green] opportunities detected\n"
                 f"Potential savings: [bold]{format_number(total_savings)}[/bold] tokens ({savings_pct:.1f}%)",
                 title="[bold]Gabb Optimization Opportunities[/bold]",
                 border_style="green",
@@ -616,10 +743,10 @@ def print_rich_report(analysis: TranscriptAnalysis, verbose: bool = False) -> No
         opp_table.add_column("Conf.", justify="right")
 
         # Show top 10 opportunities
-        for opp in analysis.opportunities[:10]:
+        for opp in opportunities[:10]:
             opp_table.add_row(
                 str(opp.turn_id),
-                opp.original_command[:40] + ("..." if len(opp.original_command) > 40 else ""),
+                _truncate(opp.original_command, 40),
                 opp.suggested_tool,
                 format_number(opp.estimated_savings),
                 f"{opp.confidence:.0%}",
@@ -639,9 +766,9 @@ def print_rich_report(analysis: TranscriptAnalysis, verbose: bool = False) -> No
         )
         for rec in recommendations:
             console.print()
-            console.print(f"[bold yellow]{rec['priority']}.[/bold yellow] [bold]{rec['title']}[/bold]")
-            console.print(f"   {rec['description']}")
-            console.print(f"   [dim]Impact:[/dim] {rec['impact']}")
-            console.print(f"   [dim]Example:[/dim] [green]{rec['example']}[/green]")
+            console.print(f"[bold yellow]{rec.priority}.[/bold yellow] [bold]{rec.title}[/bold]")
+            console.print(f"   {rec.description}")
+            console.print(f"   [dim]Impact:[/dim] {rec.impact}")
+            console.print(f"   [dim]Example:[/dim] [green]{rec.example}[/green]")
 
     console.print()
@@ -11,12 +11,17 @@ Each rule:
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from .base import Rule, RuleContext, RuleRegistry
 from .grep_to_symbol import GrepToSymbolRule
 from .read_to_structure import ReadToStructureRule
 from .multi_hop import MultiHopToDefinitionRule
 from .find_grep import FindGrepToSymbolsRule
 
+if TYPE_CHECKING:
+    from ..schemas import Opportunity, TranscriptAnalysis
+
 # Register all rules
 _registry = RuleRegistry()
 _registry.register(GrepToSymbolRule())
@@ -30,23 +35,25 @@ def get_registry() -> RuleRegistry:
     return _registry
 
 
-def detect_opportunities(analysis: "TranscriptAnalysis") -> list["Opportunity"]:
+def detect_opportunities(
+    analysis: "TranscriptAnalysis", top_k: int | None = None
+) -> list["Opportunity"]:
     """Detect all opportunities in a transcript analysis.
 
     This is the main entry point for opportunity detection.
 
     Args:
         analysis: The transcript analysis to examine.
+        top_k: If given, only return this many opportunities with the
+            highest savings.
 
     Returns:
         List of detected opportunities, sorted by estimated savings.
     """
-    from ..schemas import TranscriptAnalysis
-
-    return _registry.detect_all(analysis)
+    return _registry.detect_all(analysis, top_k=top_k)
 
 
-__all__ = [
+__all__ = (
     "Rule",
     "RuleContext",
     "RuleRegistry",
@@ -56,4 +63,4 @@ __all__ = [
     "ReadToStructureRule",
     "MultiHopToDefinitionRule",
     "FindGrepToSymbolsRule",
-]
+)
@@ -2,15 +2,24 @@
 
 from __future__ import annotations
 
+import heapq
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..schemas import Opportunity, ToolCall, TranscriptAnalysis, Turn
 
 
-@dataclass
+def _search_pattern(tc: "ToolCall") -> str | None:
+    """Search pattern of a Grep call or parsed Bash command, if any."""
+    if tc.tool_name == "Grep":
+        return tc.tool_input.get("pattern") or None
+    if tc.bash_info:
+        return tc.bash_info.pattern or None
+    return None
+
+
 class RuleContext:
     """Context provided to rules for opportunity detection.
 
@@ -18,33 +27,109 @@ class RuleContext:
     - Examine individual tool calls
     - Look at sequences of tool calls across turns
     - Access file read history
-    """
 
-    analysis: "TranscriptAnalysis"
+    Rules read these attributes for every tool call, so the class uses
+    __slots__ rather than a per-instance __dict__.
 
-    # Index of current turn being analyzed
-    current_turn_idx: int = 0
+    A context built by hand starts at the turn and tool call given by the
+    indices. The last grep and find/Glob calls are only tracked while
+    RuleRegistry.detect_all walks the transcript; on a hand-built context
+    those lookups find nothing. ``get_previous_tool_calls`` walks the
+    turns and works either way.
+    """
 
-    # Index of current tool call within the turn
-    current_tool_idx: int = 0
+    __slots__ = (
+        "analysis",
+        "current_turn_idx",
+        "current_tool_idx",
+        "current_turn",
+        "current_tool_call",
+        "current_pattern",
+        "files_read",
+        "grep_patterns",
+        "grep_result_files",
+        "tool_call_seq",
+        "last_grep_call",
+        "last_grep_seq",
+        "last_find_or_glob_call",
+        "last_find_or_glob_seq",
+    )
+
+    def __init__(
+        self,
+        analysis: "TranscriptAnalysis",
+        current_turn_idx: int = 0,
+        current_tool_idx: int = 0,
+    ) -> None:
+        self.analysis = analysis
+
+        # Index of current turn being analyzed
+        self.current_turn_idx = current_turn_idx
+
+        # Index of current tool call within the turn
+        self.current_tool_idx = current_tool_idx
+
+        # Current turn and tool call, taken from the indices when they are
+        # valid (RuleRegistry.detect_all updates them alongside the indices)
+        self.current_turn: Turn | None = None
+        self.current_tool_call: ToolCall | None = None
+
+        # Search pattern of the current Grep call or parsed Bash command, if any
+        self.current_pattern: str | None = None
+
+        turns = analysis.turns
+        if 0 <= current_turn_idx < len(turns):
+            self.current_turn = turns[current_turn_idx]
+            tool_calls = self.current_turn.tool_calls
+            if 0 <= current_tool_idx < len(tool_calls):
+                self.current_tool_call = tool_calls[current_tool_idx]
+                self.current_pattern = _search_pattern(self.current_tool_call)
+
+        # Track files that have been read (path -> tokens)
+        self.files_read: dict[str, int] = {}
+
+        # Track grep patterns seen (for sequence detection)
+        self.grep_patterns: list[tuple[int, int, str]] = []  # (turn_idx, tool_idx, pattern)
+
+        # Filenames listed in each grep call's output, keyed by id(tool_call)
+        self.grep_result_files: dict[int, frozenset[str]] = {}
+
+        # Position of the current tool call across the whole transcript
+        self.tool_call_seq = 0
+
+        # Most recent grep (Grep tool or Bash grep) and find/Glob calls before
+        # the current one, with their positions (updated by
+        # RuleRegistry.detect_all after the rules have run)
+        self.last_grep_call: ToolCall | None = None
+        self.last_grep_seq = 0
+        self.last_find_or_glob_call: ToolCall | None = None
+        self.last_find_or_glob_seq = 0
+
+    def get_last_grep_call(self, n: int = 5) -> "ToolCall | None":
+        """Get the most recent grep call among the previous N tool calls.
 
-    # Track files that have been read (path -> tokens)
-    files_read: dict[str, int] = field(default_factory=dict)
+        Args:
+            n: How many previous calls to look back over.
 
-    # Track grep patterns seen (for sequence detection)
-    grep_patterns: list[tuple[int, int, str]] = field(
-        default_factory=list
-    )  # (turn_idx, tool_idx, pattern)
+        Returns:
+            The grep call, or None if there was none within range.
+        """
+        if self.tool_call_seq - self.last_grep_seq > n:
+            return None
+        return self.last_grep_call
 
-    @property
-    def current_turn(self) -> "Turn":
-        """Get the current turn."""
-        return self.analysis.turns[self.current_turn_idx]
+    def get_last_find_or_glob_call(self, n: int = 5) -> "ToolCall | None":
+        """Get the most recent find or Glob call among the previous N tool calls.
 
-    @property
-    def current_tool_call(self) -> "ToolCall":
-        """Get the current tool call."""
-        return self.current_turn.tool_calls[self.current_tool_idx]
+        Args:
+            n: How many previous calls to look back over.
+
+        Returns:
+            The find/Glob call, or None if there was none within range.
+        """
+        if self.tool_call_seq - self.last_find_or_glob_seq > n:
+            return None
+        return self.last_find_or_glob_call
 
     def get_previous_tool_calls(self, n: int = 5) -> list["ToolCall"]:
         """Get the previous N tool calls across turns.
@@ -58,8 +143,9 @@ class RuleContext:
         result: list[ToolCall] = []
 
         # First, add tool calls from current turn before current index
+        current_calls = self.analysis.turns[self.current_turn_idx].tool_calls
         for i in range(self.current_tool_idx - 1, -1, -1):
-            result.append(self.current_turn.tool_calls[i])
+            result.append(current_calls[i])
             if len(result) >= n:
                 return result
 
@@ -95,17 +181,28 @@ class Rule(ABC):
         """Human-readable description of what this rule detects."""
         ...
 
-    @abstractmethod
+    @property
+    def tool_names(self) -> frozenset[str] | None:
+        """Tool names this rule can match, or None to see every tool call.
+
+        The registry only runs a rule against tool calls whose name is in
+        this set.
+        """
+        return None
+
     def check(self, ctx: RuleContext) -> "Opportunity | None":
         """Check if the current tool call represents an opportunity.
 
+        Override this to detect single tool call patterns. By default,
+        returns None (sequence-only rules leave it alone).
+
         Args:
             ctx: Rule context with access to current and previous tool calls.
 
         Returns:
             An Opportunity if detected, or None if no match.
         """
-        ...
+        return None
 
     def check_sequence(self, ctx: RuleContext) -> "Opportunity | None":
         """Check for multi-tool-call patterns.
@@ -130,6 +227,13 @@ class RuleRegistry:
 
     def __init__(self) -> None:
         self._rules: list[Rule] = []
+        # Rules that override check / check_sequence (so detect_all skips the
+        # default no-op implementations), indexed by tool name. The *_any
+        # lists hold the rules that apply to tool names no rule declared.
+        self._single_by_tool: dict[str, list[Rule]] = {}
+        self._sequence_by_tool: dict[str, list[Rule]] = {}
+        self._single_any: list[Rule] = []
+        self._sequence_any: list[Rule] = []
 
     def register(self, rule: Rule) -> None:
         """Register a rule for opportunity detection.
@@ -138,31 +242,58 @@ class RuleRegistry:
             rule: The rule instance to register.
         """
         self._rules.append(rule)
+        if type(rule).check is not Rule.check:
+            self._index_rule(rule, self._single_by_tool, self._single_any)
+        if type(rule).check_sequence is not Rule.check_sequence:
+            self._index_rule(rule, self._sequence_by_tool, self._sequence_any)
+
+    @staticmethod
+    def _index_rule(
+        rule: Rule, by_tool: dict[str, list[Rule]], any_tool: list[Rule]
+    ) -> None:
+        """Add a rule to the per-tool-name index, keeping registration order."""
+        tool_names = rule.tool_names
+        if tool_names is None:
+            any_tool.append(rule)
+            for rules in by_tool.values():
+                rules.append(rule)
+            return
+        for tool_name in tool_names:
+            by_tool.setdefault(tool_name, list(any_tool)).append(rule)
 
     def get_rules(self) -> list[Rule]:
         """Get all registered rules."""
         return list(self._rules)
 
-    def detect_all(self, analysis: "TranscriptAnalysis") -> list["Opportunity"]:
+    def detect_all(
+        self, analysis: "TranscriptAnalysis", top_k: int | None = None
+    ) -> list["Opportunity"]:
         """Run all rules against a transcript analysis.
 
         Args:
             analysis: The transcript analysis to examine.
+            top_k: If given, only return this many opportunities with the
+                highest savings.
 
         Returns:
-            List of all detected opportunities, sorted by savings (descending).
+            List of detected opportunities, sorted by savings (descending).
         """
-        from ..schemas import Opportunity
-
         opportunities: list[Opportunity] = []
         ctx = RuleContext(analysis=analysis)
 
         # Track what we've read for context
+        seq = 0
         for turn_idx, turn in enumerate(analysis.turns):
             ctx.current_turn_idx = turn_idx
+            ctx.current_turn = turn
 
             for tool_idx, tc in enumerate(turn.tool_calls):
                 ctx.current_tool_idx = tool_idx
+                ctx.current_tool_call = tc
+                seq += 1
+                ctx.tool_call_seq = seq
+
+                ctx.current_pattern = _search_pattern(tc)
 
                 # Update context tracking
                 if tc.tool_name == "Read":
@@ -170,23 +301,35 @@ class RuleRegistry:
                     ctx.files_read[file_path] = tc.result_tokens
 
                 if tc.bash_info and tc.bash_info.command_type == "grep":
-                    pattern = tc.bash_info.pattern
+                    pattern = ctx.current_pattern
                     if pattern:
                         ctx.grep_patterns.append((turn_idx, tool_idx, pattern))
 
-                # Run all rules
-                for rule in self._rules:
-                    # Check single-call patterns
+                # Check single-call patterns
+                for rule in self._single_by_tool.get(tc.tool_name, self._single_any):
                     opp = rule.check(ctx)
                     if opp is not None:
                         opportunities.append(opp)
 
-                    # Check sequence patterns
+                # Check sequence patterns
+                for rule in self._sequence_by_tool.get(tc.tool_name, self._sequence_any):
                     seq_opp = rule.check_sequence(ctx)
                     if seq_opp is not None:
                         opportunities.append(seq_opp)
 
+                # Remember grep and find/Glob calls for later sequence checks
+                command_type = tc.bash_info.command_type if tc.bash_info else None
+                if tc.tool_name == "Grep" or command_type == "grep":
+                    ctx.last_grep_call = tc
+                    ctx.last_grep_seq = seq
+                elif tc.tool_name == "Glob" or command_type == "find":
+                    ctx.last_find_or_glob_call = tc
+                    ctx.last_find_or_glob_seq = seq
+
+        if top_k is not None:
+            return heapq.nlargest(top_k, opportunities, key=attrgetter("estimated_savings"))
+
         # Sort by estimated savings (descending)
-        opportunities.sort(key=lambda x: x.estimated_savings, reverse=True)
+        opportunities.sort(key=attrgetter("estimated_savings"), reverse=True)
 
         return opportunities
@@ -12,14 +12,12 @@ Pattern detection:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import Iterator
 
 from .base import Rule, RuleContext
 from ..classifier import is_identifier_pattern
 from ..estimator import estimate_gabb_tool_tokens
-
-if TYPE_CHECKING:
-    from ..schemas import Opportunity, ToolCall
+from ..schemas import Opportunity, OpportunityType
 
 
 # Map file extensions to glob patterns
@@ -39,6 +37,54 @@ EXTENSION_TO_GLOB = {
     ".java": "**/*.java",
 }
 
+# Estimated result size of the suggested gabb_symbols call
+_GABB_SYMBOLS_TOKENS = estimate_gabb_tool_tokens("gabb_symbols")
+
+
+def _iter_shell_words(command: str) -> Iterator[str]:
+    """Yield the words of a shell command, honouring quotes and escapes.
+
+    A lightweight stand-in for ``shlex.split`` that splits lazily, so the
+    caller can stop at the word it needs. Unlike shlex it never raises: an
+    unterminated quote runs to the end of the command and a trailing
+    backslash is kept as is.
+    """
+    word: list[str] = []
+    in_word = False
+    i, n = 0, len(command)
+    while i < n:
+        c = command[i]
+        if c in " \t\r\n":
+            if in_word:
+                yield "".join(word)
+                word.clear()
+                in_word = False
+        elif c == "'":
+            in_word = True
+            end = command.find("'", i + 1)
+            if end == -1:
+                end = n
+            word.append(command[i + 1:end])
+            i = end
+        elif c == '"':
+            in_word = True
+            i += 1
+            while i < n and command[i] != '"':
+                if command[i] == "\\" and i + 1 < n and command[i + 1] in '"\\':
+                    i += 1
+                word.append(command[i])
+                i += 1
+        elif c == "\\" and i + 1 < n:
+            in_word = True
+            i += 1
+            word.append(command[i])
+        else:
+            in_word = True
+            word.append(c)
+        i += 1
+    if in_word:
+        yield "".join(word)
+
 
 class FindGrepToSymbolsRule(Rule):
     """Detect find+grep patterns that could use gabb_symbols."""
@@ -51,24 +97,27 @@ class FindGrepToSymbolsRule(Rule):
     def description(self) -> str:
         return "Find+grep for code patterns could use gabb_symbols"
 
+    @property
+    def tool_names(self) -> frozenset[str]:
+        return frozenset({"Bash", "Grep"})
+
     def check(self, ctx: RuleContext) -> "Opportunity | None":
         """Check for find with -exec grep pattern."""
-        from ..schemas import Opportunity, OpportunityType
-
         tc = ctx.current_tool_call
 
         # Check for find with -exec grep
         if tc.tool_name == "Bash" and tc.bash_info:
             if tc.bash_info.command_type == "find":
-                if "-exec" in tc.bash_info.raw_command and "grep" in tc.bash_info.raw_command:
+                # grep has to come after -exec to be the executed command
+                raw = tc.bash_info.raw_command
+                idx = raw.find("-exec")
+                if idx >= 0 and raw.find("grep", idx + len("-exec")) >= 0:
                     return self._detect_find_exec_grep(ctx)
 
         return None
 
     def check_sequence(self, ctx: RuleContext) -> "Opportunity | None":
         """Check for find → grep or Glob → Grep sequences."""
-        from ..schemas import Opportunity, OpportunityType
-
         tc = ctx.current_tool_call
 
         # Look for grep following a find/glob
@@ -81,14 +130,19 @@ class FindGrepToSymbolsRule(Rule):
 
     def _detect_find_exec_grep(self, ctx: RuleContext) -> "Opportunity | None":
         """Detect find -exec grep pattern."""
-        from ..schemas import Opportunity, OpportunityType
-
         tc = ctx.current_tool_call
         bash_info = tc.bash_info
 
         if not bash_info:
             return None
 
+        original_tokens = tc.result_tokens
+        gabb_tokens = _GABB_SYMBOLS_TOKENS
+        savings = max(0, original_tokens - gabb_tokens)
+
+        if savings < 50:
+            return None
+
         # Extract file pattern from find command
         file_pattern = bash_info.pattern  # -name pattern
 
@@ -102,13 +156,6 @@ class FindGrepToSymbolsRule(Rule):
         # Convert file pattern to gabb glob format
         file_glob = self._convert_to_glob(file_pattern)
 
-        original_tokens = tc.result_tokens
-        gabb_tokens = estimate_gabb_tool_tokens("gabb_symbols")
-        savings = max(0, original_tokens - gabb_tokens)
-
-        if savings < 50:
-            return None
-
         confidence = 0.70
         if savings > 300:
             confidence = 0.80
@@ -132,33 +179,23 @@ class FindGrepToSymbolsRule(Rule):
 
     def _check_find_then_grep(self, ctx: RuleContext) -> "Opportunity | None":
         """Check for find/Glob followed by grep sequence."""
-        from ..schemas import Opportunity, OpportunityType
-
         tc = ctx.current_tool_call
-        prev_calls = ctx.get_previous_tool_calls(3)
 
         # Look for a preceding find or Glob
-        find_call: ToolCall | None = None
-        for prev in prev_calls:
-            if prev.tool_name == "Glob":
-                find_call = prev
-                break
-            if prev.tool_name == "Bash" and prev.bash_info:
-                if prev.bash_info.command_type == "find":
-                    find_call = prev
-                    break
-
+        find_call = ctx.get_last_find_or_glob_call(3)
         if find_call is None:
             return None
 
-        # Get grep pattern
-        if tc.tool_name == "Grep":
-            grep_pattern = tc.tool_input.get("pattern", "")
-        elif tc.bash_info:
-            grep_pattern = tc.bash_info.pattern or ""
-        else:
+        # Calculate combined tokens
+        total_tokens = find_call.result_tokens + tc.result_tokens
+        gabb_tokens = _GABB_SYMBOLS_TOKENS
+        savings = max(0, total_tokens - gabb_tokens)
+
+        if savings < 100:
             return None
 
+        # Get grep pattern
+        grep_pattern = ctx.current_pattern
         if not grep_pattern or not is_identifier_pattern(grep_pattern):
             return None
 
@@ -170,14 +207,6 @@ class FindGrepToSymbolsRule(Rule):
         else:
             file_pattern = ""
 
-        # Calculate combined tokens
-        total_tokens = find_call.result_tokens + tc.result_tokens
-        gabb_tokens = estimate_gabb_tool_tokens("gabb_symbols")
-        savings = max(0, total_tokens - gabb_tokens)
-
-        if savings < 100:
-            return None
-
         confidence = 0.75
         if savings > 500:
             confidence = 0.85
@@ -201,16 +230,9 @@ class FindGrepToSymbolsRule(Rule):
 
     def _extract_exec_grep_pattern(self, command: str) -> str | None:
         """Extract the grep pattern from a find -exec grep command."""
-        import shlex
-
-        try:
-            parts = shlex.split(command)
-        except ValueError:
-            parts = command.split()
-
         # Look for grep and extract the pattern after it
         in_grep = False
-        for i, part in enumerate(parts):
+        for part in _iter_shell_words(command):
             if part == "grep" or part.endswith("/grep"):
                 in_grep = True
                 continue
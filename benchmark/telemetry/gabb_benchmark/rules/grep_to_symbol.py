@@ -13,23 +13,27 @@ Pattern detection:
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING
 
 from .base import Rule, RuleContext
 from ..classifier import is_identifier_pattern
 from ..estimator import estimate_gabb_tool_tokens
+from ..schemas import Opportunity, OpportunityType
 
-if TYPE_CHECKING:
-    from ..schemas import Opportunity
 
+# Pattern that suggests looking for definitions (one alternation per language form)
+DEFINITION_PATTERN = re.compile(
+    r"^\^?(?:"
+    r"(?:function|def|class|interface|type|struct|enum|trait)\s"
+    r"|export\s+(?:function|class|interface|type)"
+    r"|pub\s+(?:fn|struct|enum|trait)"
+    r"|(?:const|let|var)\s+\w+\s*="
+    r")"
+)
 
-# Patterns that suggest looking for definitions
-DEFINITION_PATTERNS = [
-    re.compile(r"^\^?(?:function|def|class|interface|type|struct|enum|trait)\s"),
-    re.compile(r"^\^?export\s+(?:function|class|interface|type)"),
-    re.compile(r"^\^?pub\s+(?:fn|struct|enum|trait)"),
-    re.compile(r"^\^?(?:const|let|var)\s+\w+\s*="),
-]
+# Estimated result sizes of the suggested gabb calls
+_GABB_SYMBOL_TOKENS = estimate_gabb_tool_tokens("gabb_symbol")
+_GABB_SYMBOLS_TOKENS = estimate_gabb_tool_tokens("gabb_symbols")
+_GABB_USAGES_TOKENS = estimate_gabb_tool_tokens("gabb_usages")
 
 
 class GrepToSymbolRule(Rule):
@@ -43,10 +47,12 @@ class GrepToSymbolRule(Rule):
     def description(self) -> str:
         return "Grep for symbol names could use gabb_symbol or gabb_usages"
 
+    @property
+    def tool_names(self) -> frozenset[str]:
+        return frozenset({"Bash", "Grep"})
+
     def check(self, ctx: RuleContext) -> "Opportunity | None":
         """Check if a grep command could be replaced with gabb tools."""
-        from ..schemas import Opportunity, OpportunityType
-
         tc = ctx.current_tool_call
 
         # Check for Bash grep commands
@@ -62,24 +68,19 @@ class GrepToSymbolRule(Rule):
 
     def _check_bash_grep(self, ctx: RuleContext) -> "Opportunity | None":
         """Check bash grep command."""
-        from ..schemas import Opportunity, OpportunityType
-
         tc = ctx.current_tool_call
         bash_info = tc.bash_info
+        pattern = ctx.current_pattern
 
-        if not bash_info or not bash_info.pattern:
+        if not bash_info or not pattern:
             return None
 
-        pattern = bash_info.pattern
-
         # Check if pattern looks like an identifier
         if not is_identifier_pattern(pattern):
             return None
 
         # Determine if this looks like a definition search or usage search
-        is_definition_search = any(
-            p.match(pattern) for p in DEFINITION_PATTERNS
-        )
+        is_definition_search = DEFINITION_PATTERN.match(pattern) is not None
 
         # Recursive grep is more likely looking for all usages
         is_usage_search = bash_info.is_recursive
@@ -87,18 +88,21 @@ class GrepToSymbolRule(Rule):
         # Calculate confidence and suggested tool
         if is_definition_search:
             suggested_tool = "gabb_symbols"
+            gabb_tokens = _GABB_SYMBOLS_TOKENS
             opportunity_type = OpportunityType.GREP_TO_SYMBOLS
             confidence = 0.75
             reason = f"Grep for definition pattern '{pattern}' - gabb_symbols provides indexed lookup"
             suggested_params = {"name_contains": pattern.strip("^$")}
         elif is_usage_search:
             suggested_tool = "gabb_usages"
+            gabb_tokens = _GABB_USAGES_TOKENS
             opportunity_type = OpportunityType.GREP_TO_USAGES
             confidence = 0.85
             reason = f"Recursive grep for symbol '{pattern}' - gabb_usages provides semantic reference search"
             suggested_params = {"name": pattern}
         else:
             suggested_tool = "gabb_symbol"
+            gabb_tokens = _GABB_SYMBOL_TOKENS
             opportunity_type = OpportunityType.GREP_TO_SYMBOL
             confidence = 0.70
             reason = f"Grep for identifier '{pattern}' - gabb_symbol provides precise definition lookup"
@@ -106,7 +110,6 @@ class GrepToSymbolRule(Rule):
 
         # Estimate token savings
         original_tokens = tc.result_tokens
-        gabb_tokens = estimate_gabb_tool_tokens(suggested_tool)
         savings = max(0, original_tokens - gabb_tokens)
 
         # Higher confidence if significant savings
@@ -129,10 +132,8 @@ class GrepToSymbolRule(Rule):
 
     def _check_grep_tool(self, ctx: RuleContext) -> "Opportunity | None":
         """Check Claude's Grep tool."""
-        from ..schemas import Opportunity, OpportunityType
-
         tc = ctx.current_tool_call
-        pattern = tc.tool_input.get("pattern", "")
+        pattern = ctx.current_pattern
 
         if not pattern or not is_identifier_pattern(pattern):
             return None
@@ -144,7 +145,7 @@ class GrepToSymbolRule(Rule):
         reason = f"Grep for identifier '{pattern}' - gabb_usages provides semantic accuracy"
 
         original_tokens = tc.result_tokens
-        gabb_tokens = estimate_gabb_tool_tokens(suggested_tool)
+        gabb_tokens = _GABB_USAGES_TOKENS
         savings = max(0, original_tokens - gabb_tokens)
 
         if savings > 500:
@@ -17,13 +17,32 @@ from typing import TYPE_CHECKING
 from .base import Rule, RuleContext
 from ..classifier import is_identifier_pattern
 from ..estimator import estimate_gabb_tool_tokens
+from ..schemas import Opportunity, OpportunityType
 
 if TYPE_CHECKING:
-    from ..schemas import Opportunity, ToolCall
+    from ..schemas import ToolCall
 
 
-# Patterns that indicate finding file:line references in grep output
-FILE_LINE_PATTERN = re.compile(r"[^:]+:\d+:")
+# Estimated result size of the suggested gabb_definition call
+_GABB_DEFINITION_TOKENS = estimate_gabb_tool_tokens("gabb_definition")
+
+# grep output line with a file and line number: "path:42:content" (or
+# "path:42-content" for context lines). The lazy path match skips the
+# colon of a Windows drive letter, which is never followed by digits and
+# another separator.
+_FILE_LINE_PREFIX = re.compile(r"(.+?):\d+[:-]")
+
+# Single-file grep -n output: "42:content", with no file name
+_LINE_ONLY_PREFIX = re.compile(r"\d+[:-]")
+
+# Path before the first content colon of "path:content" (grep without -n),
+# allowing for a leading drive letter such as "C:\"
+_FILE_CONTENT_PREFIX = re.compile(r"(?:[A-Za-z]:[\\/])?[^:]*")
+
+
+def _basename(path: str) -> str:
+    """Return the last component of a path with / or \\ separators."""
+    return path[max(path.rfind("/"), path.rfind("\\")) + 1:]
 
 
 class MultiHopToDefinitionRule(Rule):
@@ -37,15 +56,12 @@ class MultiHopToDefinitionRule(Rule):
     def description(self) -> str:
         return "Multi-hop navigation to definition could use gabb_definition"
 
-    def check(self, ctx: RuleContext) -> "Opportunity | None":
-        """Check single tool call - not applicable for this rule."""
-        # This rule uses sequence detection
-        return None
+    @property
+    def tool_names(self) -> frozenset[str]:
+        return frozenset({"Read"})
 
     def check_sequence(self, ctx: RuleContext) -> "Opportunity | None":
         """Check for multi-hop navigation patterns."""
-        from ..schemas import Opportunity, OpportunityType
-
         tc = ctx.current_tool_call
 
         # We look for Read calls that follow a grep/search
@@ -53,16 +69,20 @@ class MultiHopToDefinitionRule(Rule):
         if tc.tool_name != "Read":
             return None
 
-        # Get previous tool calls
-        prev_calls = ctx.get_previous_tool_calls(5)
-        if not prev_calls:
-            return None
-
         # Look for grep → read pattern
-        grep_call = self._find_preceding_grep(prev_calls, ctx)
+        grep_call = ctx.get_last_grep_call(5)
         if grep_call is None:
             return None
 
+        # Calculate token savings for the sequence
+        total_sequence_tokens = grep_call.result_tokens + tc.result_tokens
+        gabb_tokens = _GABB_DEFINITION_TOKENS
+        savings = max(0, total_sequence_tokens - gabb_tokens)
+
+        # Only report if savings are meaningful
+        if savings < 100:
+            return None
+
         # Check if the grep was for an identifier pattern
         grep_pattern = self._get_grep_pattern(grep_call)
         if not grep_pattern or not is_identifier_pattern(grep_pattern):
@@ -70,16 +90,7 @@ class MultiHopToDefinitionRule(Rule):
 
         # Check if this Read is targeting a file that was found in grep results
         file_path = tc.tool_input.get("file_path", "")
-        if not self._file_in_grep_results(file_path, grep_call):
-            return None
-
-        # Calculate token savings for the sequence
-        total_sequence_tokens = grep_call.result_tokens + tc.result_tokens
-        gabb_tokens = estimate_gabb_tool_tokens("gabb_definition")
-        savings = max(0, total_sequence_tokens - gabb_tokens)
-
-        # Only report if savings are meaningful
-        if savings < 100:
+        if not self._file_in_grep_results(file_path, grep_call, ctx):
             return None
 
         confidence = 0.75
@@ -103,20 +114,6 @@ class MultiHopToDefinitionRule(Rule):
             reason=f"Multi-hop navigation (grep→read) for '{grep_pattern}' - gabb_definition is single call",
         )
 
-    def _find_preceding_grep(
-        self, prev_calls: list["ToolCall"], ctx: RuleContext
-    ) -> "ToolCall | None":
-        """Find a preceding grep call in the sequence."""
-        for tc in prev_calls:
-            # Check Bash grep
-            if tc.tool_name == "Bash" and tc.bash_info:
-                if tc.bash_info.command_type == "grep":
-                    return tc
-            # Check Grep tool
-            if tc.tool_name == "Grep":
-                return tc
-        return None
-
     def _get_grep_pattern(self, tc: "ToolCall") -> str | None:
         """Extract the grep pattern from a tool call."""
         if tc.tool_name == "Bash" and tc.bash_info:
@@ -125,24 +122,56 @@ class MultiHopToDefinitionRule(Rule):
             return tc.tool_input.get("pattern")
         return None
 
-    def _file_in_grep_results(self, file_path: str, grep_call: "ToolCall") -> bool:
-        """Check if a file path was mentioned in grep results."""
+    def _file_in_grep_results(
+        self, file_path: str, grep_call: "ToolCall", ctx: RuleContext
+    ) -> bool:
+        """Check if a file path was listed in grep results."""
         if not grep_call.result_content:
             return False
 
-        # Check if any part of the file path appears in results
-        # Grep results typically show: file:line:content
-        path_parts = file_path.replace("\\", "/").split("/")
-
-        # Check for exact filename match
-        filename = path_parts[-1] if path_parts else ""
-        if filename and filename in grep_call.result_content:
-            return True
-
-        # Check for partial path match
-        for i in range(len(path_parts)):
-            partial = "/".join(path_parts[i:])
-            if partial and partial in grep_call.result_content:
-                return True
-
-        return False
+        filenames = ctx.grep_result_files.get(id(grep_call))
+        if filenames is None:
+            filenames = self._parse_grep_filenames(grep_call)
+            ctx.grep_result_files[id(grep_call)] = filenames
+
+        # Paths may be absolute on one side and relative on the other,
+        # so compare by filename
+        filename = _basename(file_path)
+        return bool(filename) and filename in filenames
+
+    def _parse_grep_filenames(self, grep_call: "ToolCall") -> frozenset[str]:
+        """Collect the filenames of the files listed in grep output.
+
+        Handles ``file:line:content``, ``file:content`` and bare ``file``
+        (``grep -l``) lines, including Windows drive-letter paths. Lines
+        of single-file ``grep -n`` output (``line:content``) name no file,
+        so they stand for the file the grep searched.
+        """
+        filenames = set()
+        searched_single_file = False
+        for line in grep_call.result_content.splitlines():
+            match = _FILE_LINE_PREFIX.match(line)
+            if match:
+                path = match.group(1)
+            elif _LINE_ONLY_PREFIX.match(line):
+                searched_single_file = True
+                continue
+            else:
+                path = _FILE_CONTENT_PREFIX.match(line).group(0)
+            path = path.strip()
+            if path:
+                filenames.add(_basename(path))
+
+        if searched_single_file:
+            target = self._get_grep_target(grep_call)
+            if target:
+                filenames.add(_basename(target))
+        return frozenset(filenames)
+
+    def _get_grep_target(self, tc: "ToolCall") -> str | None:
+        """Extract the path a grep call searched."""
+        if tc.tool_name == "Bash" and tc.bash_info:
+            return tc.bash_info.target_path
+        if tc.tool_name == "Grep":
+            return tc.tool_input.get("path")
+        return None
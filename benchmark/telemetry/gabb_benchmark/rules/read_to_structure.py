@@ -10,17 +10,13 @@ Pattern detection:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
 from .base import Rule, RuleContext
 from ..estimator import estimate_gabb_tool_tokens
-
-if TYPE_CHECKING:
-    from ..schemas import Opportunity
+from ..schemas import Opportunity, OpportunityType
 
 
 # Supported code file extensions for gabb_structure
-CODE_EXTENSIONS = {
+CODE_EXTENSIONS = frozenset({
     ".ts",
     ".tsx",
     ".js",
@@ -43,11 +39,17 @@ CODE_EXTENSIONS = {
     ".go",
     ".java",
     ".scala",
-}
+})
+
+# CODE_EXTENSIONS without the leading dot, for lookup by rpartition(".")
+_CODE_EXTENSION_SUFFIXES = frozenset(ext[1:] for ext in CODE_EXTENSIONS)
 
 # Minimum tokens to consider a file "large"
 MIN_TOKENS_FOR_STRUCTURE = 500
 
+# Estimated result size of the suggested gabb_structure call
+_GABB_STRUCTURE_TOKENS = estimate_gabb_tool_tokens("gabb_structure", "typical")
+
 
 class ReadToStructureRule(Rule):
     """Detect full file reads that could benefit from gabb_structure first."""
@@ -60,10 +62,12 @@ class ReadToStructureRule(Rule):
     def description(self) -> str:
         return "Full file read could use gabb_structure first for overview"
 
+    @property
+    def tool_names(self) -> frozenset[str]:
+        return frozenset({"Read"})
+
     def check(self, ctx: RuleContext) -> "Opportunity | None":
         """Check if a Read call could benefit from gabb_structure."""
-        from ..schemas import Opportunity, OpportunityType
-
         tc = ctx.current_tool_call
 
         if tc.tool_name != "Read":
@@ -87,7 +91,7 @@ class ReadToStructureRule(Rule):
 
         # This is a large file read that could benefit from structure first
         original_tokens = tc.result_tokens
-        structure_tokens = estimate_gabb_tool_tokens("gabb_structure", "typical")
+        structure_tokens = _GABB_STRUCTURE_TOKENS
 
         # Estimate that structure + targeted read would use ~30% of full read
         # This is conservative - in practice it could be much less
@@ -119,5 +123,5 @@ class ReadToStructureRule(Rule):
 
     def _is_code_file(self, file_path: str) -> bool:
         """Check if the file path has a supported code extension."""
-        lower_path = file_path.lower()
-        return any(lower_path.endswith(ext) for ext in CODE_EXTENSIONS)
+        _, dot, ext = file_path.rpartition(".")
+        return bool(dot) and ext.lower() in _CODE_EXTENSION_SUFFIXES
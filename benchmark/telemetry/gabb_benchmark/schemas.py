@@ -2,13 +2,37 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import Any
+from typing import Any, TypeVar
 
+_T = TypeVar("_T")
 
-class OpportunityType(Enum):
-    """Types of gabb optimization opportunities."""
+
+def _slotted(cls: type[_T]) -> type[_T]:
+    """Rebuild a dataclass with ``__slots__`` for its fields.
+
+    Equivalent to ``@dataclass(slots=True)``, which needs Python 3.10+.
+    Apply it above ``@dataclass``.
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        # Defaults live on the generated __init__; as class attributes
+        # they would clash with the slots
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+class OpportunityType(str, Enum):
+    """Types of gabb optimization opportunities.
+
+    Members are also their string values, so they hash and compare as
+    plain strings.
+    """
 
     # grep for symbol name → gabb_symbol or gabb_usages
     GREP_TO_SYMBOL = "grep_to_symbol"
@@ -27,6 +51,13 @@ class OpportunityType(Enum):
     GREP_TO_SYMBOLS = "grep_to_symbols"
 
 
+# Serialized value of each OpportunityType (a dict lookup avoids the
+# enum's value descriptor in Opportunity.to_dict, and yields a plain str,
+# since formatting a str-mixin member gives its name on Python 3.11+)
+_OPPORTUNITY_TYPE_VALUES = {member: member.value for member in OpportunityType}
+
+
+@_slotted
 @dataclass
 class Opportunity:
     """A detected gabb optimization opportunity."""
@@ -40,7 +71,7 @@ class Opportunity:
 
     # What gabb tool could replace it
     suggested_tool: str
-    suggested_params: dict[str, Any] = field(default_factory=dict)
+    suggested_params: dict[str, Any] | None = None  # None when there are none
 
     # Token economics
     original_tokens: int = 0
@@ -55,12 +86,12 @@ class Opportunity:
 
     def to_dict(self) -> dict[str, Any]:
         return {
-            "type": self.type.value,
+            "type": _OPPORTUNITY_TYPE_VALUES[self.type],
             "turn_id": self.turn_id,
             "tool_call_index": self.tool_call_index,
             "original_command": self.original_command,
             "suggested_tool": self.suggested_tool,
-            "suggested_params": self.suggested_params,
+            "suggested_params": self.suggested_params or {},
             "original_tokens": self.original_tokens,
             "estimated_gabb_tokens": self.estimated_gabb_tokens,
             "estimated_savings": self.estimated_savings,
@@ -69,6 +100,7 @@ class Opportunity:
         }
 
 
+@_slotted
 @dataclass
 class BashCommandInfo:
     """Parsed information about a Bash command."""
@@ -78,7 +110,7 @@ class BashCommandInfo:
     pattern: str | None = None  # For grep/find patterns
     target_path: str | None = None  # File/directory being operated on
     is_recursive: bool = False
-    flags: list[str] = field(default_factory=list)
+    flags: list[str] | None = None  # None when there are none
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -87,10 +119,11 @@ class BashCommandInfo:
             "pattern": self.pattern,
             "target_path": self.target_path,
             "is_recursive": self.is_recursive,
-            "flags": self.flags,
+            "flags": self.flags or [],
         }
 
 
+@_slotted
 @dataclass
 class ToolCall:
     """A single tool call extracted from a transcript."""
@@ -122,6 +155,7 @@ class ToolCall:
         return result
 
 
+@_slotted
 @dataclass
 class Turn:
     """A conversation turn (assistant response + tool results)."""
@@ -144,6 +178,7 @@ class Turn:
         }
 
 
+@_slotted
 @dataclass
 class TranscriptAnalysis:
     """Complete analysis of a transcript."""
@@ -160,26 +195,59 @@ class TranscriptAnalysis:
     # Phase 2: Detected opportunities
     opportunities: list[Opportunity] = field(default_factory=list)
 
+    @property
+    def total_tokens(self) -> int:
+        """Combined input and output tokens."""
+        return self.total_input_tokens + self.total_output_tokens
+
+    @property
+    def total_savings(self) -> int:
+        """Estimated tokens saved across all detected opportunities."""
+        return sum(opp.estimated_savings for opp in self.opportunities)
+
+    @property
+    def file_content_percentage(self) -> float:
+        """Share of total tokens spent on file content (0-100)."""
+        total_tokens = self.total_tokens
+        return (self.file_content_tokens / total_tokens * 100) if total_tokens > 0 else 0
+
     def to_dict(self) -> dict[str, Any]:
-        # Compute tool distribution
+        data = self.to_shallow_dict()
+        data["turns"] = [t.to_dict() for t in self.turns]
+        data["opportunities"] = [opp.to_dict() for opp in self.opportunities]
+        return data
+
+    def to_shallow_dict(self) -> dict[str, Any]:
+        """Like to_dict, but leave turns and opportunities as record objects.
+
+        Lets an encoder convert the records one at a time instead of
+        holding every record's dict in memory at once.
+        """
+        # Compute tool distribution, bash breakdown and call count in one pass
         tool_dist: dict[str, dict[str, int]] = {}
         bash_breakdown: dict[str, int] = {}
+        tool_dist_get = tool_dist.get
+        bash_breakdown_get = bash_breakdown.get
+        tool_call_count = 0
 
         for turn in self.turns:
+            tool_call_count += len(turn.tool_calls)
             for tc in turn.tool_calls:
-                if tc.tool_name not in tool_dist:
-                    tool_dist[tc.tool_name] = {"count": 0, "tokens": 0}
-                tool_dist[tc.tool_name]["count"] += 1
-                tool_dist[tc.tool_name]["tokens"] += tc.result_tokens
+                tool_name = tc.tool_name
+                slot = tool_dist_get(tool_name)
+                if slot is None:
+                    slot = tool_dist[tool_name] = {"count": 0, "tokens": 0}
+                slot["count"] += 1
+                slot["tokens"] += tc.result_tokens
 
                 # Track bash command types
-                if tc.tool_name == "Bash" and tc.bash_info:
+                if tool_name == "Bash" and tc.bash_info:
                     cmd_type = tc.bash_info.command_type
-                    bash_breakdown[cmd_type] = bash_breakdown.get(cmd_type, 0) + 1
+                    bash_breakdown[cmd_type] = bash_breakdown_get(cmd_type, 0) + 1
 
         # Compute opportunity summary
-        total_savings = sum(opp.estimated_savings for opp in self.opportunities)
-        total_tokens = self.total_input_tokens + self.total_output_tokens
+        total_savings = self.total_savings
+        total_tokens = self.total_tokens
         savings_percentage = (total_savings / total_tokens * 100) if total_tokens > 0 else 0
 
         return {
@@ -190,13 +258,13 @@ class TranscriptAnalysis:
                 "total_input_tokens": self.total_input_tokens,
                 "total_output_tokens": self.total_output_tokens,
                 "file_content_tokens": self.file_content_tokens,
-                "tool_call_count": sum(len(t.tool_calls) for t in self.turns),
+                "tool_call_count": tool_call_count,
                 "gabb_opportunity_count": len(self.opportunities),
                 "potential_token_savings": total_savings,
                 "savings_percentage": round(savings_percentage, 1),
             },
-            "turns": [t.to_dict() for t in self.turns],
+            "turns": self.turns,
             "tool_distribution": tool_dist,
             "bash_breakdown": bash_breakdown,
-            "opportunities": [opp.to_dict() for opp in self.opportunities],
+            "opportunities": self.opportunities,
         }
@@ -1,9 +1,13 @@
 """Pytest configuration and fixtures."""
 
+import json
 from pathlib import Path
 
 import pytest
 
+from gabb_benchmark.parser import load_jsonl_transcript
+from gabb_benchmark.schemas import TranscriptAnalysis
+
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
@@ -14,6 +18,12 @@ def simple_transcript_path() -> Path:
     return FIXTURES_DIR / "simple_transcript.json"
 
 
+@pytest.fixture(scope="session")
+def simple_transcript_data() -> dict:
+    """Decoded simple transcript, loaded once per session (do not mutate)."""
+    return json.loads((FIXTURES_DIR / "simple_transcript.json").read_text())
+
+
 @pytest.fixture
 def multi_tool_transcript_path() -> Path:
     """Path to a transcript with multiple parallel tool calls."""
@@ -24,3 +34,9 @@ def multi_tool_transcript_path() -> Path:
 def claude_code_native_path() -> Path:
     """Path to a Claude Code native JSONL transcript."""
     return FIXTURES_DIR / "claude_code_native.jsonl"
+
+
+@pytest.fixture(scope="session")
+def claude_code_native_analysis() -> TranscriptAnalysis:
+    """Parsed Claude Code native transcript, loaded once per session (do not mutate)."""
+    return load_jsonl_transcript(FIXTURES_DIR / "claude_code_native.jsonl")
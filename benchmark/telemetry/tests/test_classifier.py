@@ -32,6 +32,28 @@ class TestBashCommandParser:
         assert info.is_recursive
         assert "-rn" in info.flags
 
+    def test_parse_without_flags(self):
+        """Test that commands without flags serialize an empty flag list."""
+        info = parse_bash_command("cat src/auth.ts")
+
+        assert info.flags is None
+        assert info.to_dict()["flags"] == []
+
+    def test_parse_is_cached(self):
+        """Test that repeated commands reuse the parsed result."""
+        assert parse_bash_command("git status") is parse_bash_command("git status")
+
+    def test_long_commands_not_cached(self):
+        """Test that long commands such as heredocs are parsed but not cached."""
+        from gabb_benchmark.classifier import MAX_CACHED_COMMAND_LENGTH
+
+        command = "cat <<'EOF' > notes.txt\n" + "x" * MAX_CACHED_COMMAND_LENGTH + "\nEOF"
+        info = parse_bash_command(command)
+
+        assert info.command_type == "cat"
+        assert info is not parse_bash_command(command)
+        assert info == parse_bash_command(command)
+
     def test_parse_grep_with_e_flag(self):
         """Test parsing grep with -e flag."""
         info = parse_bash_command("grep -e 'pattern1' -e 'pattern2' file.txt")
@@ -132,6 +154,20 @@ class TestIdentifierPattern:
         assert not is_identifier_pattern("")
         assert not is_identifier_pattern("a")  # Too short
 
+    def test_long_patterns_not_cached(self):
+        """Test that long patterns are checked but not cached."""
+        from gabb_benchmark.classifier import (
+            MAX_CACHED_PATTERN_LENGTH,
+            _is_identifier_pattern_cached,
+        )
+
+        _is_identifier_pattern_cached.cache_clear()
+        pattern = "Service" * MAX_CACHED_PATTERN_LENGTH
+
+        assert is_identifier_pattern(pattern)
+        assert is_identifier_pattern("UserService")
+        assert _is_identifier_pattern_cached.cache_info().currsize == 1
+
 
 class TestClassifyToolCalls:
     """Tests for classify_tool_calls."""
@@ -80,6 +80,29 @@ def test_cli_analyze_summary(simple_transcript_path: Path, multi_tool_transcript
     assert "Transcripts analyzed:" in captured.out
 
 
+def test_cli_analyze_jobs_matches_sequential(
+    simple_transcript_path: Path, multi_tool_transcript_path: Path, capsys
+):
+    """Test --jobs produces the same reports, in the same order."""
+    files = [str(simple_transcript_path), str(multi_tool_transcript_path)]
+
+    assert main(["analyze", *files, "--format", "json"]) == 0
+    sequential = capsys.readouterr().out
+    assert main(["analyze", *files, "--format", "json", "--jobs", "2"]) == 0
+    parallel = capsys.readouterr().out
+
+    assert parallel == sequential
+
+
+@pytest.mark.parametrize("jobs", ["0", "-2", "many"])
+def test_cli_analyze_jobs_rejects_invalid(simple_transcript_path: Path, jobs: str, capsys):
+    """Test --jobs rejects values below 1 instead of running sequentially."""
+    with pytest.raises(SystemExit) as exc_info:
+        main(["analyze", str(simple_transcript_path), "--jobs", jobs])
+    assert exc_info.value.code == 2
+    assert "--jobs" in capsys.readouterr().err
+
+
 def test_cli_analyze_markdown_output(simple_transcript_path: Path, capsys):
     """Test markdown output format."""
     result = main(["analyze", str(simple_transcript_path), "--format", "markdown"])
@@ -117,6 +117,19 @@ class TestEstimateTranscriptTokens:
         # (because context accumulates)
         assert analysis.turns[1].input_tokens > analysis.turns[0].input_tokens
 
+    def test_total_tokens_and_file_content_percentage(self):
+        """Test derived totals on the analysis."""
+        analysis = parse_transcript({"messages": []})
+        assert analysis.total_tokens == 0
+        assert analysis.file_content_percentage == 0
+
+        analysis.total_input_tokens = 300
+        analysis.total_output_tokens = 100
+        analysis.file_content_tokens = 100
+
+        assert analysis.total_tokens == 400
+        assert analysis.file_content_percentage == 25
+
 
 class TestGabbToolEstimates:
     """Tests for gabb tool token estimates."""
@@ -1,15 +1,18 @@
 """Tests for transcript parser."""
 
 import json
+from itertools import chain
 from pathlib import Path
 
 import pytest
 
+from gabb_benchmark import parser
 from gabb_benchmark.parser import (
     parse_transcript,
     load_transcript,
     load_jsonl_transcript,
     parse_claude_code_jsonl,
+    parse_jsonl_transcript,
 )
 from gabb_benchmark.schemas import TranscriptAnalysis
 
@@ -43,8 +46,71 @@ def test_parse_multi_tool_transcript(multi_tool_transcript_path: Path):
 
     # First turn has two parallel tool calls
     assert len(analysis.turns[0].tool_calls) == 2
-    tool_names = {tc.tool_name for tc in analysis.turns[0].tool_calls}
-    assert tool_names == {"Bash", "Grep"}
+    tool_names = sorted(tc.tool_name for tc in analysis.turns[0].tool_calls)
+    assert tool_names == ["Bash", "Grep"]
+
+
+@pytest.mark.parametrize("name", [None, 42])
+def test_parse_non_string_tool_name(name):
+    """Test that a null or non-string tool name is kept as is."""
+    tool_use = {"type": "tool_use", "id": "toolu_01", "name": name, "input": {}}
+    analysis = parse_transcript({"messages": [
+        {"role": "user", "content": "Hi"},
+        {"role": "assistant", "content": [tool_use]},
+    ]})
+    native = parse_claude_code_jsonl([
+        {"type": "assistant", "message": {"content": [tool_use]}},
+    ])
+
+    assert analysis.turns[0].tool_calls[0].tool_name == name
+    assert native.turns[0].tool_calls[0].tool_name == name
+
+
+@pytest.mark.parametrize("decoder", ["orjson", "json"])
+def test_load_transcript_decoders(simple_transcript_path: Path, tmp_path: Path, monkeypatch, decoder):
+    """Test both JSON decoders load transcripts and reject invalid JSON."""
+    module = pytest.importorskip(decoder)
+    monkeypatch.setattr(parser, "_json_loads", module.loads)
+
+    analysis = load_transcript(simple_transcript_path)
+    assert len(analysis.turns) == 3
+
+    bad = tmp_path / "bad.json"
+    bad.write_text("{not json")
+    with pytest.raises(json.JSONDecodeError):
+        load_transcript(bad)
+
+
+@pytest.mark.parametrize("decoder", ["orjson", "json"])
+@pytest.mark.parametrize("encoding", ["utf-8-sig", "utf-16", "utf-16-le", "utf-32"])
+def test_load_transcript_utf_encodings(
+    simple_transcript_path: Path, tmp_path: Path, monkeypatch, decoder, encoding
+):
+    """Test that non-UTF-8 and BOM-prefixed transcripts load with either decoder."""
+    module = pytest.importorskip(decoder)
+    monkeypatch.setattr(parser, "_json_loads", module.loads)
+    path = tmp_path / "transcript.json"
+    path.write_bytes(simple_transcript_path.read_text(encoding="utf-8").encode(encoding))
+
+    analysis = load_transcript(path)
+
+    assert analysis.to_dict() == load_transcript(simple_transcript_path).to_dict()
+
+
+@pytest.mark.parametrize("decoder", ["orjson", "json"])
+def test_load_jsonl_transcript_with_bom(
+    claude_code_native_path: Path, tmp_path: Path, monkeypatch, decoder
+):
+    """Test that a BOM-prefixed JSONL transcript loads with either decoder."""
+    module = pytest.importorskip(decoder)
+    monkeypatch.setattr(parser, "_json_loads", module.loads)
+    data = b"\xef\xbb\xbf" + claude_code_native_path.read_bytes()
+    path = tmp_path / "transcript.jsonl"
+    path.write_bytes(data)
+    expected = load_jsonl_transcript(claude_code_native_path).to_dict()
+
+    assert load_jsonl_transcript(path).to_dict() == expected
+    assert parse_jsonl_transcript(data).to_dict() == expected
 
 
 def test_parse_empty_transcript():
@@ -55,6 +121,16 @@ def test_parse_empty_transcript():
     assert analysis.task_description == ""
 
 
+def test_parsed_records_use_slots(simple_transcript_data: dict):
+    """Test that parsed records are slotted and still serialize."""
+    analysis = parse_transcript(simple_transcript_data)
+    tc = analysis.turns[0].tool_calls[0]
+
+    assert not hasattr(analysis, "__dict__")
+    assert not hasattr(tc, "__dict__")
+    assert analysis.to_dict()["turns"][0]["tool_calls"][0] == tc.to_dict()
+
+
 def test_parse_user_only_message():
     """Test parsing with only user messages (no assistant response yet)."""
     data = {
@@ -108,22 +184,29 @@ def test_load_claude_code_native_jsonl(claude_code_native_path: Path):
     assert "QDP" in analysis.task_description
 
 
-def test_claude_code_jsonl_extracts_turns(claude_code_native_path: Path):
+@pytest.mark.parametrize("mode", ["rb", "r"])
+def test_load_jsonl_transcript_from_stream(claude_code_native_path: Path, mode):
+    """Test loading JSONL from an open binary or text stream."""
+    with open(claude_code_native_path, mode) as f:
+        analysis = load_jsonl_transcript(f)
+
+    assert analysis.to_dict() == load_jsonl_transcript(claude_code_native_path).to_dict()
+
+
+def test_claude_code_jsonl_extracts_turns(claude_code_native_analysis: TranscriptAnalysis):
     """Test that turns are correctly extracted from Claude Code JSONL."""
-    analysis = load_jsonl_transcript(claude_code_native_path)
+    analysis = claude_code_native_analysis
 
     # Should have 4 assistant turns (text, tool_use, text+tool_use, text)
     assert len(analysis.turns) == 4
 
 
-def test_claude_code_jsonl_extracts_tool_calls(claude_code_native_path: Path):
+def test_claude_code_jsonl_extracts_tool_calls(claude_code_native_analysis: TranscriptAnalysis):
     """Test that tool calls are extracted from Claude Code JSONL."""
-    analysis = load_jsonl_transcript(claude_code_native_path)
+    analysis = claude_code_native_analysis
 
     # Find all tool calls
-    all_tool_calls = []
-    for turn in analysis.turns:
-        all_tool_calls.extend(turn.tool_calls)
+    all_tool_calls = list(chain.from_iterable(t.tool_calls for t in analysis.turns))
 
     assert len(all_tool_calls) == 2
 
@@ -137,16 +220,16 @@ def test_claude_code_jsonl_extracts_tool_calls(claude_code_native_path: Path):
     assert all_tool_calls[1].tool_input["file"] == "astropy/io/ascii/qdp.py"
 
 
-def test_claude_code_jsonl_extracts_tool_results(claude_code_native_path: Path):
+def test_claude_code_jsonl_extracts_tool_results(claude_code_native_analysis: TranscriptAnalysis):
     """Test that tool results are matched to tool calls."""
-    analysis = load_jsonl_transcript(claude_code_native_path)
+    analysis = claude_code_native_analysis
 
     # Find tool calls with results
-    tool_calls_with_results = []
-    for turn in analysis.turns:
-        for tc in turn.tool_calls:
-            if tc.result_content:
-                tool_calls_with_results.append(tc)
+    tool_calls_with_results = [
+        tc
+        for tc in chain.from_iterable(t.tool_calls for t in analysis.turns)
+        if tc.result_content
+    ]
 
     assert len(tool_calls_with_results) == 2
 
@@ -158,9 +241,9 @@ def test_claude_code_jsonl_extracts_tool_results(claude_code_native_path: Path):
     assert "symbols" in tool_calls_with_results[1].result_content
 
 
-def test_claude_code_jsonl_extracts_token_usage(claude_code_native_path: Path):
+def test_claude_code_jsonl_extracts_token_usage(claude_code_native_analysis: TranscriptAnalysis):
     """Test that token usage is extracted from Claude Code JSONL."""
-    analysis = load_jsonl_transcript(claude_code_native_path)
+    analysis = claude_code_native_analysis
 
     # Total tokens should be sum of all assistant message usage
     # Based on fixture: 1000+1050+1200+1300 = 4550 input, 50+100+75+60 = 285 output
@@ -180,37 +263,46 @@ def test_claude_code_jsonl_skips_queue_operations():
     assert len(analysis.turns) == 0  # No assistant turns yet
 
 
+def test_claude_code_jsonl_accepts_iterator(claude_code_native_path: Path):
+    """Test that records can be streamed in from a generator."""
+    with open(claude_code_native_path, "rb") as f:
+        analysis = parse_claude_code_jsonl(json.loads(line) for line in f if line.strip())
+
+    assert analysis.to_dict() == load_jsonl_transcript(claude_code_native_path).to_dict()
+
+
 def test_format_detection_claude_code():
     """Test that Claude Code JSONL format is correctly detected."""
-    from gabb_benchmark.parser import load_jsonl_transcript
-    import tempfile
-
-    # Create a temp file with Claude Code format
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-        f.write('{"type":"user","sessionId":"s1","message":{"role":"user","content":"Hi"}}\n')
-        f.write('{"type":"assistant","sessionId":"s1","message":{"content":[{"type":"text","text":"Hello!"}]}}\n')
-        temp_path = f.name
+    analysis = parse_jsonl_transcript(
+        b'{"type":"user","sessionId":"s1","message":{"role":"user","content":"Hi"}}\n'
+        b'{"type":"assistant","sessionId":"s1","message":{"content":[{"type":"text","text":"Hello!"}]}}\n'
+    )
 
-    try:
-        analysis = load_jsonl_transcript(temp_path)
-        assert analysis.session_id == "s1"
-        assert len(analysis.turns) == 1
-    finally:
-        Path(temp_path).unlink()
+    assert analysis.session_id == "s1"
+    assert len(analysis.turns) == 1
 
 
 def test_format_detection_messages_api():
     """Test that Messages API format is still detected in JSONL context."""
-    from gabb_benchmark.parser import load_jsonl_transcript
-    import tempfile
-
-    # Create a temp file with Messages API format (single JSON per line)
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-        f.write('{"messages":[{"role":"user","content":"Hi"},{"role":"assistant","content":"Hello!"}]}\n')
-        temp_path = f.name
-
-    try:
-        analysis = load_jsonl_transcript(temp_path)
-        assert len(analysis.turns) == 1
-    finally:
-        Path(temp_path).unlink()
+    analysis = parse_jsonl_transcript(
+        '{"messages":[{"role":"user","content":"Hi"},{"role":"assistant","content":"Hello!"}]}\n'
+    )
+
+    assert len(analysis.turns) == 1
+
+
+@pytest.mark.parametrize("separator", ["\u2028", "\u2029", "\x85"])
+def test_parse_jsonl_raw_line_separator_in_string(separator):
+    """Test that Unicode line separators inside JSON strings don't split records."""
+    text = f"Find{separator}the QDP class"
+    data = (
+        json.dumps({"type": "user", "sessionId": "s1",
+                    "message": {"role": "user", "content": text}}, ensure_ascii=False)
+        + "\n"
+        + '{"type":"assistant","sessionId":"s1","message":{"content":[]}}\n'
+    )
+
+    analysis = parse_jsonl_transcript(data)
+
+    assert analysis.task_description == text
+    assert len(analysis.turns) == 1
@@ -1,15 +1,17 @@
 """Tests for reporter module."""
 
+import copy
 import json
-from pathlib import Path
 
 import pytest
 
-from gabb_benchmark.parser import load_transcript
+from gabb_benchmark.parser import parse_transcript
 from gabb_benchmark.classifier import classify_tool_calls
 from gabb_benchmark.estimator import estimate_transcript_tokens
 from gabb_benchmark.rules import detect_opportunities
+from gabb_benchmark import reporter
 from gabb_benchmark.reporter import (
+    Recommendation,
     format_number,
     generate_json_report,
     generate_text_report,
@@ -18,16 +20,35 @@ from gabb_benchmark.reporter import (
 )
 
 
-@pytest.fixture
-def analyzed_transcript(simple_transcript_path: Path):
-    """Load and analyze a transcript."""
-    analysis = load_transcript(simple_transcript_path)
+@pytest.fixture(scope="module")
+def analyzed_transcript(simple_transcript_data: dict):
+    """Load and analyze a transcript once for the module.
+
+    Tests must not mutate it; copy it first to change a field.
+    """
+    analysis = parse_transcript(simple_transcript_data)
     classify_tool_calls(analysis)
     estimate_transcript_tokens(analysis)
     analysis.opportunities = detect_opportunities(analysis)
     return analysis
 
 
+def _missing_markers(report: str, markers: tuple[str, ...]) -> list[str]:
+    """Return the markers that do not appear in the report, in order."""
+    return [marker for marker in markers if marker not in report]
+
+
+def _missing_headings(report: str, headings: tuple[str, ...]) -> list[str]:
+    """Return the headings that do not start any line of the report, in order."""
+    # One pass over the lines keeps only those starting with some heading
+    candidates = [line for line in report.splitlines() if line.startswith(headings)]
+    return [
+        heading
+        for heading in headings
+        if not any(line.startswith(heading) for line in candidates)
+    ]
+
+
 def test_format_number():
     """Test number formatting with thousands separator."""
     assert format_number(1000) == "1,000"
@@ -37,9 +58,10 @@ def test_format_number():
 
 
 def test_generate_json_report(analyzed_transcript):
-    """Test JSON report generation."""
-    report = generate_json_report(analyzed_transcript)
-    data = json.loads(report)
+    """Test the structure of the data behind the JSON report."""
+    # The report is the encoded to_dict(); the encoder tests below check
+    # the round trip, so assert on the dict without dumping and reparsing
+    data = analyzed_transcript.to_dict()
 
     assert "summary" in data
     assert "turns" in data
@@ -48,33 +70,85 @@ def test_generate_json_report(analyzed_transcript):
     assert data["summary"]["total_turns"] > 0
 
 
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_generate_json_report_encoders_agree(analyzed_transcript, monkeypatch, use_orjson):
+    """Test that orjson and the json fallback encode the same data."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(reporter, "HAS_ORJSON", use_orjson)
+
+    report = generate_json_report(analyzed_transcript)
+
+    assert report.startswith('{\n  "session_id"')
+    assert json.loads(report) == analyzed_transcript.to_dict()
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_generate_json_report_to_stream(analyzed_transcript, monkeypatch, use_orjson):
+    """Test JSON report can be written to text and byte-backed streams."""
+    import io
+
+    if use_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(reporter, "HAS_ORJSON", use_orjson)
+    expected = generate_json_report(analyzed_transcript) + "\n"
+
+    text_out = io.StringIO()
+    assert generate_json_report(analyzed_transcript, out=text_out) is None
+    assert text_out.getvalue() == expected
+
+    raw = io.BytesIO()
+    wrapped = io.TextIOWrapper(raw, encoding="utf-8")
+    wrapped.write("before\n")
+    generate_json_report(analyzed_transcript, out=wrapped)
+    wrapped.flush()
+    assert raw.getvalue().decode("utf-8") == "before\n" + expected
+
+
 def test_generate_text_report(analyzed_transcript):
     """Test text report generation."""
     report = generate_text_report(analyzed_transcript)
 
-    assert "Gabb Benchmark Report" in report
-    assert "TOKEN SUMMARY" in report
-    assert "TOOL DISTRIBUTION" in report
+    assert _missing_markers(report, (
+        "Gabb Benchmark Report",
+        "TOKEN SUMMARY",
+        "TOOL DISTRIBUTION",
+    )) == []
+
+
+def test_generate_text_report_to_stream(analyzed_transcript):
+    """Test text report can be written directly to a stream."""
+    import io
+
+    out = io.StringIO()
+    result = generate_text_report(analyzed_transcript, out=out)
+
+    assert result is None
+    assert out.getvalue() == generate_text_report(analyzed_transcript) + "\n"
 
 
 def test_generate_markdown_report(analyzed_transcript):
     """Test markdown report generation."""
     report = generate_markdown_report(analyzed_transcript)
 
-    assert "# Gabb Benchmark Report" in report
-    assert "## Summary" in report
-    assert "| Metric | Value |" in report
-    assert "## Tool Distribution" in report
+    assert _missing_headings(report, (
+        "# Gabb Benchmark Report",
+        "## Summary",
+        "| Metric | Value |",
+        "## Tool Distribution",
+    )) == []
 
 
 def test_generate_markdown_report_verbose(analyzed_transcript):
     """Test markdown report with verbose mode."""
     report = generate_markdown_report(analyzed_transcript, verbose=True)
 
-    assert "## Per-Turn Breakdown" in report
-    assert "### Detailed Tool Calls" in report
-    # Should include turn details
-    assert "**Turn" in report
+    assert _missing_headings(report, (
+        "## Per-Turn Breakdown",
+        "### Detailed Tool Calls",
+        # Should include turn details
+        "**Turn",
+    )) == []
 
 
 def test_generate_markdown_report_with_opportunities(analyzed_transcript):
@@ -82,8 +156,10 @@ def test_generate_markdown_report_with_opportunities(analyzed_transcript):
     # Only run if there are opportunities
     if analyzed_transcript.opportunities:
         report = generate_markdown_report(analyzed_transcript)
-        assert "## Gabb Optimization Opportunities" in report
-        assert "## Recommendations" in report
+        assert _missing_headings(report, (
+            "## Gabb Optimization Opportunities",
+            "## Recommendations",
+        )) == []
 
 
 def test_generate_recommendations_empty():
@@ -105,18 +181,107 @@ def test_generate_recommendations_with_opportunities(analyzed_transcript):
     if recs:
         # Each recommendation should have required fields
         for rec in recs:
-            assert "priority" in rec
-            assert "title" in rec
-            assert "description" in rec
-            assert "impact" in rec
-            assert "example" in rec
+            assert isinstance(rec, Recommendation)
+            assert rec.priority >= 1
+            assert rec.title
+            assert rec.description
+            assert rec.impact
+            assert rec.example
+
+
+def test_generate_recommendations_ordered_by_priority():
+    """Test recommendations follow priority order and include counts."""
+    from gabb_benchmark.schemas import Opportunity, OpportunityType, TranscriptAnalysis
+
+    analysis = TranscriptAnalysis(
+        opportunities=[
+            Opportunity(
+                type=OpportunityType.GREP_TO_SYMBOLS,
+                turn_id=1,
+                tool_call_index=0,
+                original_command="grep '^def '",
+                suggested_tool="gabb_symbols",
+                estimated_savings=200,
+            ),
+            Opportunity(
+                type=OpportunityType.READ_TO_STRUCTURE,
+                turn_id=2,
+                tool_call_index=0,
+                original_command="Read full file 'a.py'",
+                suggested_tool="gabb_structure",
+                estimated_savings=1500,
+            ),
+            Opportunity(
+                type=OpportunityType.READ_TO_STRUCTURE,
+                turn_id=3,
+                tool_call_index=0,
+                original_command="Read full file 'b.py'",
+                suggested_tool="gabb_structure",
+                estimated_savings=500,
+            ),
+        ]
+    )
+    recs = generate_recommendations(analysis)
+
+    assert [rec.priority for rec in recs] == [1, 6]
+    assert recs[0].description.startswith("Found 2 large file read(s)")
+    assert recs[0].impact == "~2,000 tokens saved"
+
+
+def test_split_by_impact_boundaries():
+    """Test impact grouping at the savings thresholds."""
+    from gabb_benchmark.reporter import _split_by_impact
+    from gabb_benchmark.schemas import Opportunity, OpportunityType
+
+    opportunities = [
+        Opportunity(
+            type=OpportunityType.GREP_TO_USAGES,
+            turn_id=1,
+            tool_call_index=0,
+            original_command="grep",
+            suggested_tool="gabb_usages",
+            estimated_savings=savings,
+        )
+        for savings in (2000, 1000, 999, 500, 499, 0)
+    ]
+    high, medium, low = _split_by_impact(opportunities)
+
+    assert [o.estimated_savings for o in high] == [2000, 1000]
+    assert [o.estimated_savings for o in medium] == [999, 500]
+    assert [o.estimated_savings for o in low] == [499, 0]
+    assert _split_by_impact([]) == ([], [], [])
+
+
+def test_markdown_report_groups_unsorted_opportunities(analyzed_transcript):
+    """Test impact grouping when opportunities were assigned out of order."""
+    from gabb_benchmark.schemas import Opportunity, OpportunityType
+
+    analyzed = copy.copy(analyzed_transcript)
+    analyzed.opportunities = [
+        Opportunity(
+            type=OpportunityType.GREP_TO_USAGES,
+            turn_id=turn_id,
+            tool_call_index=0,
+            original_command=f"grep {turn_id}",
+            suggested_tool="gabb_usages",
+            estimated_savings=savings,
+        )
+        for turn_id, savings in ((1, 500), (2, 1500))
+    ]
+    report = generate_markdown_report(analyzed)
+
+    high = report.split("### High Impact", 1)[1].split("### Medium Impact", 1)
+    assert "**Turn 2**" in high[0]
+    assert "**Turn 1**" not in high[0]
+    assert "**Turn 1**" in high[1]
 
 
 def test_markdown_report_escapes_special_chars(analyzed_transcript):
     """Test that markdown report handles special characters."""
     # Add a task description with special markdown chars
-    analyzed_transcript.task_description = "Fix the `auth` bug with **priority**"
-    report = generate_markdown_report(analyzed_transcript)
+    analyzed = copy.copy(analyzed_transcript)
+    analyzed.task_description = "Fix the `auth` bug with **priority**"
+    report = generate_markdown_report(analyzed)
 
     # Should include the task description
     assert "Fix the `auth` bug with **priority**" in report
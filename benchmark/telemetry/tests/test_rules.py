@@ -22,6 +22,14 @@ from gabb_benchmark.rules.multi_hop import MultiHopToDefinitionRule
 from gabb_benchmark.rules.find_grep import FindGrepToSymbolsRule
 
 
+# Opportunity types produced by GrepToSymbolRule
+_GREP_OPP_TYPES = frozenset({
+    OpportunityType.GREP_TO_SYMBOL,
+    OpportunityType.GREP_TO_USAGES,
+    OpportunityType.GREP_TO_SYMBOLS,
+})
+
+
 def make_analysis(turns: list[Turn]) -> TranscriptAnalysis:
     """Helper to create a TranscriptAnalysis with given turns."""
     return TranscriptAnalysis(
@@ -36,6 +44,17 @@ def make_turn(turn_id: int, tool_calls: list[ToolCall]) -> Turn:
     return Turn(turn_id=turn_id, tool_calls=tool_calls)
 
 
+def make_calls_analysis(*tool_calls_per_turn: list[ToolCall]) -> TranscriptAnalysis:
+    """Helper to create a TranscriptAnalysis with one turn per tool-call list.
+
+    Turns are numbered from 1, e.g. ``make_calls_analysis([tc1], [tc2, tc3])``.
+    """
+    return make_analysis([
+        make_turn(turn_id, list(tool_calls))
+        for turn_id, tool_calls in enumerate(tool_calls_per_turn, start=1)
+    ])
+
+
 def make_bash_tool_call(
     command: str,
     command_type: str,
@@ -45,20 +64,19 @@ def make_bash_tool_call(
     result_tokens: int = 500,
 ) -> ToolCall:
     """Helper to create a Bash tool call with parsed info."""
-    tc = ToolCall(
+    return ToolCall(
         tool_name="Bash",
         tool_input={"command": command},
         tool_use_id="toolu_test",
         result_tokens=result_tokens,
+        bash_info=BashCommandInfo(
+            raw_command=command,
+            command_type=command_type,
+            pattern=pattern,
+            target_path=target_path,
+            is_recursive=is_recursive,
+        ),
     )
-    tc.bash_info = BashCommandInfo(
-        raw_command=command,
-        command_type=command_type,
-        pattern=pattern,
-        target_path=target_path,
-        is_recursive=is_recursive,
-    )
-    return tc
 
 
 def make_read_tool_call(
@@ -68,11 +86,11 @@ def make_read_tool_call(
     limit: Optional[int] = None,
 ) -> ToolCall:
     """Helper to create a Read tool call."""
-    tool_input = {"file_path": file_path}
-    if offset is not None:
-        tool_input["offset"] = offset
-    if limit is not None:
-        tool_input["limit"] = limit
+    tool_input = {
+        key: value
+        for key, value in (("file_path", file_path), ("offset", offset), ("limit", limit))
+        if value is not None
+    }
     return ToolCall(
         tool_name="Read",
         tool_input=tool_input,
@@ -109,6 +127,98 @@ class TestRuleRegistry:
         assert "multi_hop_to_definition" in rule_names
         assert "find_grep_to_symbols" in rule_names
 
+    def test_registry_skips_default_check_sequence(self, monkeypatch):
+        """Test that only rules overriding check_sequence run it."""
+        calls = []
+
+        class SingleRule(Rule):
+            name = "single"
+            description = "Overrides check only"
+
+            def check(self, ctx):
+                calls.append(("single.check", ctx.current_tool_call.tool_name))
+                return None
+
+        class SequenceRule(SingleRule):
+            name = "sequence"
+            description = "Overrides check and check_sequence"
+
+            def check_sequence(self, ctx):
+                calls.append(("sequence.check_sequence", ctx.current_tool_call.tool_name))
+                return None
+
+        registry = RuleRegistry()
+        single = SingleRule()
+        sequence = SequenceRule()
+        registry.register(single)
+        registry.register(sequence)
+
+        def default_check_sequence(self, ctx):
+            calls.append((f"{self.name}.default_check_sequence", ctx.current_tool_call.tool_name))
+            return None
+
+        monkeypatch.setattr(Rule, "check_sequence", default_check_sequence)
+        registry.detect_all(make_calls_analysis([make_grep_tool_call("x")]))
+
+        assert registry.get_rules() == [single, sequence]
+        assert calls == [
+            ("single.check", "Grep"),
+            ("single.check", "Grep"),
+            ("sequence.check_sequence", "Grep"),
+        ]
+
+    def test_registry_indexes_rules_by_tool_name(self):
+        """Test that rules only run for the tool names they declare."""
+        seen = []
+
+        class RecordingRule(Rule):
+            description = "Records the tool calls it is run against"
+
+            def __init__(self, name, tool_names):
+                self._name = name
+                self._tool_names = tool_names
+
+            @property
+            def name(self):
+                return self._name
+
+            @property
+            def tool_names(self):
+                return self._tool_names
+
+            def check(self, ctx):
+                seen.append((ctx.current_tool_call.tool_name, self.name))
+                return None
+
+        registry = RuleRegistry()
+        registry.register(RecordingRule("read", frozenset({"Read"})))
+        registry.register(RecordingRule("any", None))
+        registry.register(RecordingRule("grep", frozenset({"Grep"})))
+
+        registry.detect_all(make_calls_analysis(
+            [make_read_tool_call("a.ts"), make_grep_tool_call("x")],
+            [make_bash_tool_call("ls", command_type="ls")],
+        ))
+
+        # Registration order is kept for each tool name
+        assert seen == [
+            ("Read", "read"),
+            ("Read", "any"),
+            ("Grep", "any"),
+            ("Grep", "grep"),
+            ("Bash", "any"),
+        ]
+
+    def test_registry_indexes_sequence_only_rules_once(self):
+        """Test that a rule without its own check is only run for sequences."""
+        registry = RuleRegistry()
+        rule = MultiHopToDefinitionRule()
+        registry.register(rule)
+
+        assert registry._single_by_tool == {}
+        assert registry._single_any == []
+        assert registry._sequence_by_tool == {"Read": [rule]}
+
     def test_detect_opportunities_empty_analysis(self):
         """Test detection on empty analysis."""
         analysis = make_analysis([])
@@ -116,73 +226,105 @@ class TestRuleRegistry:
 
         assert opportunities == []
 
+    def test_detect_opportunities_top_k(self):
+        """Test that top_k keeps the highest-savings opportunities."""
+        calls = [
+            make_read_tool_call(f"file{i}.ts", result_tokens=tokens)
+            for i, tokens in enumerate([1000, 3000, 2000])
+        ]
+        analysis = make_calls_analysis(calls)
+
+        all_opps = detect_opportunities(analysis)
+        top = detect_opportunities(analysis, top_k=2)
+
+        assert len(all_opps) == 3
+        assert top == all_opps[:2]
+        assert [opp.original_tokens for opp in top] == [3000, 2000]
+
+    def test_total_savings(self):
+        """Test that total_savings sums the detected opportunities."""
+        calls = [
+            make_read_tool_call(f"file{i}.ts", result_tokens=tokens)
+            for i, tokens in enumerate([1000, 3000])
+        ]
+        analysis = make_calls_analysis(calls)
+        assert analysis.total_savings == 0
 
-class TestGrepToSymbolRule:
-    """Tests for the GrepToSymbol rule."""
+        analysis.opportunities = detect_opportunities(analysis)
 
-    def test_recursive_grep_for_identifier(self):
-        """Test detection of recursive grep for an identifier."""
-        tc = make_bash_tool_call(
-            command="grep -rn 'handleAuth' src/",
-            command_type="grep",
-            pattern="handleAuth",
-            target_path="src/",
-            is_recursive=True,
-            result_tokens=1000,
+        expected = sum(opp.estimated_savings for opp in analysis.opportunities)
+        assert expected > 0
+        assert analysis.total_savings == expected
+        assert analysis.to_dict()["summary"]["potential_token_savings"] == expected
+
+    def test_opportunity_type_serializes_as_plain_string(self):
+        """Test that to_dict emits the type value, not the enum member."""
+        opp = Opportunity(
+            type=OpportunityType.GREP_TO_USAGES,
+            turn_id=1,
+            tool_call_index=0,
+            original_command="grep -rn handleAuth",
+            suggested_tool="gabb_usages",
         )
-        analysis = make_analysis([make_turn(1, [tc])])
 
-        opportunities = detect_opportunities(analysis)
+        assert OpportunityType.GREP_TO_USAGES == "grep_to_usages"
+        assert type(opp.to_dict()["type"]) is str
+        assert opp.to_dict()["type"] == "grep_to_usages"
 
-        assert len(opportunities) >= 1
-        opp = opportunities[0]
-        assert opp.type == OpportunityType.GREP_TO_USAGES
-        assert opp.suggested_tool == "gabb_usages"
-        assert opp.estimated_savings > 0
-        assert opp.confidence >= 0.7
 
-    def test_non_recursive_grep_for_identifier(self):
-        """Test detection of non-recursive grep for an identifier."""
+class TestGrepToSymbolRule:
+    """Tests for the GrepToSymbol rule."""
+
+    @pytest.mark.parametrize(
+        "command,pattern,is_recursive,result_tokens,expected_type,expected_tool",
+        [
+            pytest.param(
+                "grep -rn 'handleAuth' src/", "handleAuth", True, 1000,
+                OpportunityType.GREP_TO_USAGES, "gabb_usages",
+                id="recursive_identifier",
+            ),
+            pytest.param(
+                "grep 'UserService' file.ts", "UserService", False, 500,
+                OpportunityType.GREP_TO_SYMBOL, "gabb_symbol",
+                id="non_recursive_identifier",
+            ),
+            pytest.param(
+                "grep 'error:' logs.txt", "error:", False, 500, None, None,
+                id="non_identifier_no_match",
+            ),
+        ],
+    )
+    def test_bash_grep(
+        self, command, pattern, is_recursive, result_tokens, expected_type, expected_tool
+    ):
+        """Test the opportunity (if any) detected for a Bash grep."""
         tc = make_bash_tool_call(
-            command="grep 'UserService' file.ts",
+            command=command,
             command_type="grep",
-            pattern="UserService",
-            is_recursive=False,
-            result_tokens=500,
+            pattern=pattern,
+            is_recursive=is_recursive,
+            result_tokens=result_tokens,
         )
-        analysis = make_analysis([make_turn(1, [tc])])
+        analysis = make_calls_analysis([tc])
 
         opportunities = detect_opportunities(analysis)
 
+        if expected_type is None:
+            grep_opps = [o for o in opportunities if o.type in _GREP_OPP_TYPES]
+            assert len(grep_opps) == 0
+            return
+
         assert len(opportunities) >= 1
         opp = opportunities[0]
-        assert opp.type == OpportunityType.GREP_TO_SYMBOL
-        assert opp.suggested_tool == "gabb_symbol"
-
-    def test_grep_non_identifier_no_match(self):
-        """Test that grep for non-identifier patterns is not flagged."""
-        tc = make_bash_tool_call(
-            command="grep 'error:' logs.txt",
-            command_type="grep",
-            pattern="error:",
-            result_tokens=500,
-        )
-        analysis = make_analysis([make_turn(1, [tc])])
-
-        opportunities = detect_opportunities(analysis)
-
-        # Should not detect opportunity for non-identifier pattern
-        grep_opps = [o for o in opportunities if o.type in (
-            OpportunityType.GREP_TO_SYMBOL,
-            OpportunityType.GREP_TO_USAGES,
-            OpportunityType.GREP_TO_SYMBOLS,
-        )]
-        assert len(grep_opps) == 0
+        assert opp.type == expected_type
+        assert opp.suggested_tool == expected_tool
+        assert opp.estimated_savings > 0
+        assert opp.confidence >= 0.7
 
     def test_grep_tool_for_identifier(self):
         """Test detection of Claude's Grep tool for identifier."""
         tc = make_grep_tool_call(pattern="processData", result_tokens=800)
-        analysis = make_analysis([make_turn(1, [tc])])
+        analysis = make_calls_analysis([tc])
 
         opportunities = detect_opportunities(analysis)
 
@@ -195,93 +337,153 @@ class TestGrepToSymbolRule:
 class TestReadToStructureRule:
     """Tests for the ReadToStructure rule."""
 
-    def test_full_file_read_large_code_file(self):
-        """Test detection of full file read on large code file."""
+    @pytest.mark.parametrize(
+        "file_path,result_tokens,offset,limit,expect_match",
+        [
+            pytest.param("src/services/auth.ts", 1500, None, None, True, id="large_code_file"),
+            pytest.param("src/services/auth.ts", 500, 100, 50, False, id="targeted_read_no_match"),
+            pytest.param("src/config.ts", 200, None, None, False, id="small_file_no_match"),
+            pytest.param("README.md", 1000, None, None, False, id="non_code_file_no_match"),
+        ],
+    )
+    def test_read(self, file_path, result_tokens, offset, limit, expect_match):
+        """Test whether a Read is flagged for gabb_structure."""
         tc = make_read_tool_call(
-            file_path="src/services/auth.ts",
-            result_tokens=1500,
+            file_path=file_path,
+            result_tokens=result_tokens,
+            offset=offset,
+            limit=limit,
         )
-        analysis = make_analysis([make_turn(1, [tc])])
+        analysis = make_calls_analysis([tc])
 
         opportunities = detect_opportunities(analysis)
 
+        read_opps = [o for o in opportunities if o.type == OpportunityType.READ_TO_STRUCTURE]
+        if not expect_match:
+            assert len(read_opps) == 0
+            return
+
         assert len(opportunities) >= 1
         opp = opportunities[0]
         assert opp.type == OpportunityType.READ_TO_STRUCTURE
         assert opp.suggested_tool == "gabb_structure"
         assert opp.estimated_savings > 0
 
-    def test_targeted_read_no_match(self):
-        """Test that targeted reads with offset/limit are not flagged."""
-        tc = make_read_tool_call(
-            file_path="src/services/auth.ts",
-            result_tokens=500,
-            offset=100,
-            limit=50,
-        )
-        analysis = make_analysis([make_turn(1, [tc])])
 
-        opportunities = detect_opportunities(analysis)
+class TestMultiHopRule:
+    """Tests for the MultiHopToDefinition rule."""
 
-        # Should not detect opportunity for targeted read
-        read_opps = [o for o in opportunities if o.type == OpportunityType.READ_TO_STRUCTURE]
-        assert len(read_opps) == 0
+    def test_grep_then_read_sequence(self):
+        """Test detection of grep followed by read."""
+        grep_tc = make_bash_tool_call(
+            command="grep -rn 'handleAuth' src/",
+            command_type="grep",
+            pattern="handleAuth",
+            is_recursive=True,
+            result_tokens=500,
+        )
+        grep_tc.result_content = "src/auth.ts:42: function handleAuth"
 
-    def test_small_file_read_no_match(self):
-        """Test that small file reads are not flagged."""
-        tc = make_read_tool_call(
-            file_path="src/config.ts",
-            result_tokens=200,  # Below threshold
+        read_tc = make_read_tool_call(
+            file_path="src/auth.ts",
+            result_tokens=1000,
         )
-        analysis = make_analysis([make_turn(1, [tc])])
+
+        analysis = make_calls_analysis([grep_tc], [read_tc])
 
         opportunities = detect_opportunities(analysis)
 
-        read_opps = [o for o in opportunities if o.type == OpportunityType.READ_TO_STRUCTURE]
-        assert len(read_opps) == 0
+        multi_hop = [o for o in opportunities if o.type == OpportunityType.MULTI_HOP_TO_DEFINITION]
+        assert len(multi_hop) >= 1
 
-    def test_non_code_file_no_match(self):
-        """Test that non-code files are not flagged."""
-        tc = make_read_tool_call(
-            file_path="README.md",
+    def test_grep_then_read_absolute_path(self):
+        """Test that a Read by absolute path matches a relative grep hit."""
+        grep_tc = make_grep_tool_call(pattern="handleAuth", result_tokens=500)
+        grep_tc.result_content = "src/auth.ts:42: function handleAuth\nsrc/app.ts:7: handleAuth()"
+
+        read_tc = make_read_tool_call(
+            file_path="/repo/src/auth.ts",
             result_tokens=1000,
         )
-        analysis = make_analysis([make_turn(1, [tc])])
 
-        opportunities = detect_opportunities(analysis)
+        analysis = make_calls_analysis([grep_tc], [read_tc])
 
-        read_opps = [o for o in opportunities if o.type == OpportunityType.READ_TO_STRUCTURE]
-        assert len(read_opps) == 0
+        opportunities = detect_opportunities(analysis)
 
+        multi_hop = [o for o in opportunities if o.type == OpportunityType.MULTI_HOP_TO_DEFINITION]
+        assert len(multi_hop) == 1
+
+    @pytest.mark.parametrize(
+        "result_content,file_path",
+        [
+            pytest.param(
+                "C:\\repo\\src\\auth.ts:42: function handleAuth",
+                "C:\\repo\\src\\auth.ts",
+                id="windows_drive_letter",
+            ),
+            pytest.param(
+                "C:\\repo\\src\\auth.ts: function handleAuth",
+                "C:\\repo\\src\\auth.ts",
+                id="windows_drive_letter_no_line_numbers",
+            ),
+            pytest.param(
+                "src/auth.ts: function handleAuth",
+                "src/auth.ts",
+                id="no_line_numbers",
+            ),
+        ],
+    )
+    def test_grep_output_path_formats(self, result_content, file_path):
+        """Test that grep hits are matched across output path formats."""
+        grep_tc = make_grep_tool_call(pattern="handleAuth", result_tokens=500)
+        grep_tc.result_content = result_content
+        read_tc = make_read_tool_call(file_path=file_path, result_tokens=1000)
 
-class TestMultiHopRule:
-    """Tests for the MultiHopToDefinition rule."""
+        opportunities = detect_opportunities(make_calls_analysis([grep_tc], [read_tc]))
 
-    def test_grep_then_read_sequence(self):
-        """Test detection of grep followed by read."""
+        multi_hop = [o for o in opportunities if o.type == OpportunityType.MULTI_HOP_TO_DEFINITION]
+        assert len(multi_hop) == 1
+
+    @pytest.mark.parametrize(
+        "read_path,expected",
+        [
+            pytest.param("src/auth.ts", 1, id="searched_file"),
+            pytest.param("src/42", 0, id="line_number_not_a_file"),
+        ],
+    )
+    def test_single_file_grep_then_read(self, read_path, expected):
+        """Test that single-file grep -n output stands for the searched file."""
         grep_tc = make_bash_tool_call(
-            command="grep -rn 'handleAuth' src/",
+            command="grep -n 'handleAuth' src/auth.ts",
             command_type="grep",
             pattern="handleAuth",
-            is_recursive=True,
+            target_path="src/auth.ts",
             result_tokens=500,
         )
-        grep_tc.result_content = "src/auth.ts:42: function handleAuth"
+        grep_tc.result_content = "42:export function handleAuth() {\n57:  handleAuth();"
+        read_tc = make_read_tool_call(file_path=read_path, result_tokens=1000)
+
+        opportunities = detect_opportunities(make_calls_analysis([grep_tc], [read_tc]))
+
+        multi_hop = [o for o in opportunities if o.type == OpportunityType.MULTI_HOP_TO_DEFINITION]
+        assert len(multi_hop) == expected
+
+    def test_read_of_file_only_mentioned_in_grep_content_no_match(self):
+        """Test that a file named only inside matched lines is not a grep hit."""
+        grep_tc = make_grep_tool_call(pattern="handleAuth", result_tokens=500)
+        grep_tc.result_content = "src/app.ts:7: import { handleAuth } from './auth.ts'"
 
         read_tc = make_read_tool_call(
             file_path="src/auth.ts",
             result_tokens=1000,
         )
 
-        analysis = make_analysis([
-            make_turn(1, [grep_tc]),
-            make_turn(2, [read_tc]),
-        ])
+        analysis = make_calls_analysis([grep_tc], [read_tc])
 
         opportunities = detect_opportunities(analysis)
 
         multi_hop = [o for o in opportunities if o.type == OpportunityType.MULTI_HOP_TO_DEFINITION]
-        assert len(multi_hop) >= 1
+        assert len(multi_hop) == 0
 
     def test_read_without_preceding_grep_no_match(self):
         """Test that standalone reads don't trigger multi-hop detection."""
@@ -290,7 +492,7 @@ class TestMultiHopRule:
             result_tokens=1000,
         )
 
-        analysis = make_analysis([make_turn(1, [read_tc])])
+        analysis = make_calls_analysis([read_tc])
 
         opportunities = detect_opportunities(analysis)
 
@@ -309,7 +511,7 @@ class TestFindGrepRule:
             pattern="*.ts",
             result_tokens=600,
         )
-        analysis = make_analysis([make_turn(1, [tc])])
+        analysis = make_calls_analysis([tc])
 
         opportunities = detect_opportunities(analysis)
 
@@ -317,6 +519,18 @@ class TestFindGrepRule:
         assert len(find_grep) >= 1
         assert find_grep[0].suggested_tool == "gabb_symbols"
 
+    def test_find_exec_grep_double_quoted_pattern(self):
+        """Test the grep pattern is unquoted from a find -exec command."""
+        rule = FindGrepToSymbolsRule()
+
+        assert rule._extract_exec_grep_pattern(
+            'find src -name "*.py" -exec grep -n "process_data" {} \\;'
+        ) == "process_data"
+        assert rule._extract_exec_grep_pattern(
+            "find . -exec /usr/bin/grep -l 'it'\\''s' {} +"
+        ) == "it's"
+        assert rule._extract_exec_grep_pattern("find . -name '*.ts'") is None
+
     def test_glob_then_grep_sequence(self):
         """Test detection of Glob followed by Grep."""
         glob_tc = ToolCall(
@@ -333,10 +547,7 @@ class TestFindGrepRule:
             result_tokens=500,
         )
 
-        analysis = make_analysis([
-            make_turn(1, [glob_tc]),
-            make_turn(2, [grep_tc]),
-        ])
+        analysis = make_calls_analysis([glob_tc], [grep_tc])
 
         opportunities = detect_opportunities(analysis)
 
@@ -344,64 +555,63 @@ class TestFindGrepRule:
         assert len(find_grep) >= 1
 
 
-class TestOpportunityIntegration:
-    """Integration tests for opportunity detection."""
+@pytest.fixture(scope="module")
+def integration_analysis():
+    """Analysis with several detectable calls, shared by the integration tests."""
+    # Create multiple tool calls with different savings potential
+    tc1 = make_bash_tool_call(
+        command="grep -rn 'handleAuth' src/",
+        command_type="grep",
+        pattern="handleAuth",
+        is_recursive=True,
+        result_tokens=2000,  # High savings
+    )
 
-    def test_multiple_opportunities_sorted_by_savings(self):
-        """Test that opportunities are sorted by estimated savings."""
-        # Create multiple tool calls with different savings potential
-        tc1 = make_bash_tool_call(
-            command="grep -rn 'handleAuth' src/",
-            command_type="grep",
-            pattern="handleAuth",
-            is_recursive=True,
-            result_tokens=2000,  # High savings
-        )
+    tc2 = make_read_tool_call(
+        file_path="src/auth.ts",
+        result_tokens=500,  # Lower savings
+    )
 
-        tc2 = make_read_tool_call(
-            file_path="src/auth.ts",
-            result_tokens=500,  # Lower savings
-        )
+    tc3 = make_bash_tool_call(
+        command="grep -rn 'UserService' src/",
+        command_type="grep",
+        pattern="UserService",
+        is_recursive=True,
+        result_tokens=1500,  # Medium savings
+    )
 
-        tc3 = make_bash_tool_call(
-            command="grep -rn 'UserService' src/",
-            command_type="grep",
-            pattern="UserService",
-            is_recursive=True,
-            result_tokens=1500,  # Medium savings
-        )
+    analysis = make_calls_analysis([tc1], [tc2], [tc3])
+    # Simulate token estimation (normally done by estimate_transcript_tokens)
+    analysis.total_input_tokens = 5000
+    analysis.total_output_tokens = 2000
+    return analysis
 
-        analysis = make_analysis([
-            make_turn(1, [tc1]),
-            make_turn(2, [tc2]),
-            make_turn(3, [tc3]),
-        ])
 
-        opportunities = detect_opportunities(analysis)
+@pytest.fixture(scope="module")
+def integration_opps(integration_analysis):
+    """Opportunities detected once for the shared integration analysis."""
+    opportunities = detect_opportunities(integration_analysis)
+    integration_analysis.opportunities = opportunities
+    return opportunities
+
+
+class TestOpportunityIntegration:
+    """Integration tests for opportunity detection."""
+
+    def test_multiple_opportunities_sorted_by_savings(self, integration_opps):
+        """Test that opportunities are sorted by estimated savings."""
+        assert len(integration_opps) >= 2
 
         # Should be sorted by savings (descending)
-        if len(opportunities) >= 2:
-            for i in range(len(opportunities) - 1):
-                assert opportunities[i].estimated_savings >= opportunities[i + 1].estimated_savings
+        savings = [o.estimated_savings for o in integration_opps]
+        assert savings == sorted(savings, reverse=True)
 
-    def test_analysis_opportunities_populated(self):
+    def test_analysis_opportunities_populated(self, integration_analysis, integration_opps):
         """Test that opportunities are properly stored in analysis."""
-        tc = make_bash_tool_call(
-            command="grep -rn 'handleAuth' src/",
-            command_type="grep",
-            pattern="handleAuth",
-            is_recursive=True,
-            result_tokens=1000,
-        )
-        analysis = make_analysis([make_turn(1, [tc])])
-        # Simulate token estimation (normally done by estimate_transcript_tokens)
-        analysis.total_input_tokens = 5000
-        analysis.total_output_tokens = 2000
-        analysis.opportunities = detect_opportunities(analysis)
-
-        data = analysis.to_dict()
+        data = integration_analysis.to_dict()
 
         assert "opportunities" in data
+        assert data["summary"]["gabb_opportunity_count"] == len(integration_opps)
         assert data["summary"]["gabb_opportunity_count"] >= 1
         assert data["summary"]["potential_token_savings"] > 0
         assert data["summary"]["savings_percentage"] > 0
@@ -410,16 +620,43 @@ class TestOpportunityIntegration:
 class TestRuleContext:
     """Tests for the RuleContext class."""
 
+    def test_hand_built_context_sets_current_call(self):
+        """Test that a context built from indices can be checked by rules."""
+        read_tc = make_read_tool_call("src/services/auth.ts", result_tokens=1500)
+        grep_tc = make_grep_tool_call("processData", result_tokens=800)
+        analysis = make_calls_analysis([read_tc], [grep_tc])
+
+        ctx = RuleContext(analysis, current_turn_idx=1, current_tool_idx=0)
+
+        assert ctx.current_turn is analysis.turns[1]
+        assert ctx.current_tool_call is grep_tc
+        assert ctx.current_pattern == "processData"
+        opp = GrepToSymbolRule().check(ctx)
+        assert opp is not None
+        assert opp.type == OpportunityType.GREP_TO_USAGES
+
+        ctx = RuleContext(analysis)
+        assert ReadToStructureRule().check(ctx).type == OpportunityType.READ_TO_STRUCTURE
+
+    def test_hand_built_context_out_of_range(self):
+        """Test that invalid indices leave the current call unset."""
+        analysis = make_calls_analysis([make_read_tool_call("a.ts")])
+
+        ctx = RuleContext(analysis, current_turn_idx=0, current_tool_idx=3)
+        assert ctx.current_turn is analysis.turns[0]
+        assert ctx.current_tool_call is None
+
+        ctx = RuleContext(make_analysis([]))
+        assert ctx.current_turn is None
+        assert ctx.current_tool_call is None
+
     def test_get_previous_tool_calls(self):
         """Test getting previous tool calls across turns."""
         tc1 = make_read_tool_call("file1.ts")
         tc2 = make_read_tool_call("file2.ts")
         tc3 = make_read_tool_call("file3.ts")
 
-        analysis = make_analysis([
-            make_turn(1, [tc1]),
-            make_turn(2, [tc2, tc3]),
-        ])
+        analysis = make_calls_analysis([tc1], [tc2, tc3])
 
         ctx = RuleContext(analysis=analysis)
         ctx.current_turn_idx = 1
@@ -430,15 +667,58 @@ class TestRuleContext:
         # Should get tc2, tc1 (in reverse order)
         assert len(prev) == 2
 
-    def test_current_turn_and_tool(self):
-        """Test current_turn and current_tool_call properties."""
-        tc = make_read_tool_call("test.ts")
-        turn = make_turn(1, [tc])
-        analysis = make_analysis([turn])
+    def test_get_previous_tool_calls_across_several_turns(self):
+        """Test that the walk crosses turn boundaries, most recent first."""
+        calls = [make_read_tool_call(f"file{i}.ts") for i in range(7)]
+        analysis = make_calls_analysis(calls[:2], calls[2:3], calls[3:])
 
         ctx = RuleContext(analysis=analysis)
-        ctx.current_turn_idx = 0
-        ctx.current_tool_idx = 0
+        ctx.current_turn_idx = 2
+        ctx.current_tool_idx = 3  # calls[6]
+        walked = ctx.get_previous_tool_calls(5)
+
+        assert [tc.tool_input["file_path"] for tc in walked] == [
+            "file5.ts", "file4.ts", "file3.ts", "file2.ts", "file1.ts",
+        ]
+
+    def test_last_grep_call_respects_lookback(self):
+        """Test that the remembered grep call expires after N tool calls."""
+        grep = make_grep_tool_call("handleAuth")
+        reads = [make_read_tool_call(f"file{i}.ts") for i in range(3)]
+        seen = []
+
+        class RecordingRule(Rule):
+            name = "recording"
+            description = "Records the preceding grep call"
+
+            def check(self, ctx):
+                seen.append(ctx.get_last_grep_call(2))
+                return None
+
+        registry = RuleRegistry()
+        registry.register(RecordingRule())
+        registry.detect_all(make_calls_analysis([grep], reads))
+
+        assert seen == [None, grep, grep, None]
+
+    def test_current_turn_and_tool(self):
+        """Test that detect_all sets current_turn and current_tool_call."""
+        tc1 = make_read_tool_call("file1.ts")
+        tc2 = make_read_tool_call("file2.ts")
+        turn1 = make_turn(1, [tc1])
+        turn2 = make_turn(2, [tc2])
+        seen = []
+
+        class RecordingRule(Rule):
+            name = "recording"
+            description = "Records the current turn and tool call"
+
+            def check(self, ctx):
+                seen.append((ctx.current_turn, ctx.current_tool_call))
+                return None
+
+        registry = RuleRegistry()
+        registry.register(RecordingRule())
+        registry.detect_all(make_analysis([turn1, turn2]))
 
-        assert ctx.current_turn == turn
-        assert ctx.current_tool_call == tc
+        assert seen == [(turn1, tc1), (turn2, tc2)]